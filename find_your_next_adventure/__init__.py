@@ -8,6 +8,17 @@ __description__ = (
     "Extract and generate structured JSON data from adventure travel guides"
 )
 
-from . import models, parsers, utils
+import importlib
+from typing import Any
 
 __all__ = ["models", "parsers", "utils"]
+
+
+def __getattr__(name: str) -> Any:
+    # Import subpackages on first access (PEP 562) so that importing the package,
+    # e.g. for __version__, does not pull in PyMuPDF and the Ollama client.
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,9 @@
+"""
+Compatibility helpers for the data models.
+"""
+
+import sys
+
+# dataclass(slots=True) is only available from Python 3.10; older interpreters
+# fall back to regular dataclasses with a per-instance __dict__.
+DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -1,14 +1,30 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Any
 
+from ._compat import DATACLASS_OPTIONS
 from .destination import Destination
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class Chapter:
     title: str
     description: str
-    latitudeRange: Dict[str, str]
+    latitudeRange: dict[str, str]
     totalDestinations: int
-    destinations: List[Destination]
-    metadata: Dict[str, str]
+    destinations: list[Destination]
+    metadata: dict[str, str]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the chapter as a plain, JSON-ready dict."""
+        return {
+            "title": self.title,
+            "description": self.description,
+            "latitudeRange": self.latitudeRange,
+            "totalDestinations": self.totalDestinations,
+            "destinations": [
+                destination.to_dict() for destination in self.destinations
+            ],
+            "metadata": self.metadata,
+        }
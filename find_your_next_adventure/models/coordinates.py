@@ -1,9 +1,23 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
+from typing import Any
+
+from ._compat import DATACLASS_OPTIONS
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class Coordinates:
     latitude: float
     longitude: float
     latitudeDirection: str
     longitudeDirection: str
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the coordinates as a plain dict."""
+        return {
+            "latitude": self.latitude,
+            "longitude": self.longitude,
+            "latitudeDirection": self.latitudeDirection,
+            "longitudeDirection": self.longitudeDirection,
+        }
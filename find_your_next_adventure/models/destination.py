@@ -1,9 +1,13 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
+from typing import Any
 
+from ._compat import DATACLASS_OPTIONS
 from .coordinates import Coordinates
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_OPTIONS)
 class ExtendedLinks:
     streetView: str = ""
     googleEarth: str = ""
@@ -12,8 +16,23 @@ class ExtendedLinks:
     openStreetMap: str = ""
     appleMaps: str = ""
 
+    def to_dict(self) -> dict[str, str]:
+        """Return the links as a plain dict."""
+        return {
+            "streetView": self.streetView,
+            "googleEarth": self.googleEarth,
+            "satelliteView": self.satelliteView,
+            "googleImages": self.googleImages,
+            "openStreetMap": self.openStreetMap,
+            "appleMaps": self.appleMaps,
+        }
+
+
+# ExtendedLinks is immutable, so destinations without links can all share one
+EMPTY_EXTENDED_LINKS = ExtendedLinks()
+
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class Destination:
     id: int
     location: str
@@ -23,8 +42,18 @@ class Destination:
     mainAttractionEn: str = ""
     mainAttractionFr: str = ""
     googleMapsLink: str = ""
-    extendedLinks: ExtendedLinks = None
+    extendedLinks: ExtendedLinks = EMPTY_EXTENDED_LINKS
 
-    def __post_init__(self):
-        if self.extendedLinks is None:
-            self.extendedLinks = ExtendedLinks()
+    def to_dict(self) -> dict[str, Any]:
+        """Return the destination as a plain, JSON-ready dict."""
+        return {
+            "id": self.id,
+            "location": self.location,
+            "coordinates": self.coordinates.to_dict(),
+            "country": self.country,
+            "region": self.region,
+            "mainAttractionEn": self.mainAttractionEn,
+            "mainAttractionFr": self.mainAttractionFr,
+            "googleMapsLink": self.googleMapsLink,
+            "extendedLinks": self.extendedLinks.to_dict(),
+        }
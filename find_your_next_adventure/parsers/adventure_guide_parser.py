@@ -1,15 +1,18 @@
-import json
 import logging
+import os
 import re
-from dataclasses import asdict
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-
-import fitz  # PyMuPDF
+from types import MappingProxyType, ModuleType
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union, cast
 
 from find_your_next_adventure.models.chapter import Chapter
 from find_your_next_adventure.models.coordinates import Coordinates
 from find_your_next_adventure.models.destination import Destination, ExtendedLinks
+from find_your_next_adventure.utils.file_io import write_json
 from find_your_next_adventure.utils.maps import (
     generate_extended_links,
     generate_google_maps_link,
@@ -18,10 +21,148 @@ from find_your_next_adventure.utils.ollama_generator import OllamaGenerator
 
 logger = logging.getLogger(__name__)
 
+# "<id>. <location> - Latitude: <lat> <N|S> Longitude: <lng> <E|W>"
+# Whitespace is restricted to [^\S\n] so that, with re.MULTILINE, a match can
+# never run across two lines when scanning the whole document at once.
+DESTINATION_PATTERN = re.compile(
+    r"^[^\S\n]*(\d+)\.[^\S\n]+(.+?)[^\S\n]+-[^\S\n]+"
+    r"Latitude:[^\S\n]*([\d.-]+)[^\S\n]*([NS])[^\S\n]+"
+    r"Longitude:[^\S\n]*([\d.-]+)[^\S\n]*([EW])?",
+    re.MULTILINE,
+)
+
+# Any line starting like a numbered entry ("<id>. "), whether or not the
+# rest is well-formed; those DESTINATION_PATTERN rejects are near-misses
+# recorded as failed lines for the debug report
+CANDIDATE_PATTERN = re.compile(r"^[^\S\n]*\d+\.(?!\d).*", re.MULTILINE)
+
+_NUMBER_CHARS = frozenset("0123456789.-")
+
+DestinationFields = Tuple[str, str, str, str, str, Optional[str]]
+
+
+def _split_destination_line(line: str) -> Optional[DestinationFields]:
+    """
+    Split a stripped destination line in its canonical spacing.
+
+    Returns the same groups as ``DESTINATION_PATTERN`` using only
+    ``str.partition``/``str.split``, or None when the line deviates from the
+    canonical form, in which case the caller falls back to the pattern.
+    """
+    id_str, sep, rest = line.partition(". ")
+    if not sep or not id_str.isdecimal():
+        return None
+    location, sep, coords = rest.partition(" - Latitude: ")
+    if not sep or not location.strip():
+        return None
+    lat_part, sep, lng_part = coords.partition(" Longitude: ")
+    if not sep:
+        return None
+
+    lat_fields = lat_part.split()
+    lng_fields = lng_part.split()
+    if (
+        len(lat_fields) != 2
+        or lat_fields[1] not in ("N", "S")
+        or not lng_fields
+        or not _NUMBER_CHARS.issuperset(lat_fields[0])
+        or not _NUMBER_CHARS.issuperset(lng_fields[0])
+    ):
+        return None
+
+    # Like the pattern's optional ([EW])?, anything else leaves it unset
+    lng_dir = lng_fields[1][:1] if len(lng_fields) > 1 else ""
+    return (
+        id_str,
+        location,
+        lat_fields[0],
+        lat_fields[1],
+        lng_fields[0],
+        lng_dir if lng_dir in ("E", "W") else None,
+    )
+
+
+# Misspellings found in the source guide
+LOCATION_CORRECTIONS = {
+    "SOLVENIA": "SLOVENIA",
+    "PAPAU NEW GUINEA": "PAPUA NEW GUINEA",
+    "TAJIKSTAN": "TAJIKISTAN",
+}
+LOCATION_CORRECTIONS_PATTERN = re.compile(
+    "|".join(map(re.escape, LOCATION_CORRECTIONS))
+)
+
+# A maximal run of word characters: the unit that \b-delimited keywords match
+WORD_PATTERN = re.compile(r"\w+")
+
+# Below this many pages, starting worker processes costs more than it saves
+PARALLEL_PAGE_THRESHOLD = 64
+
+# Number of output files written concurrently
+JSON_WRITE_WORKERS = 4
+
+# Failed lines kept for the debug report; later failures are only counted
+FAILED_LINES_SAMPLE_SIZE = 50
+
+# What parse_pdf_content's "processed" and "failed" stats count, recorded in
+# the debug report so its success rate is not compared with per-line counts
+STATS_SCOPE = (
+    'processed and failed count numbered entry lines ("<id>. ..."); other '
+    "text such as headers, page numbers or wrapped continuation lines is "
+    "not counted"
+)
+
+
+def _sample_failure(failed_lines: List[str], entry: str) -> None:
+    """Keep a failed entry for the debug report while the sample has room."""
+    if len(failed_lines) < FAILED_LINES_SAMPLE_SIZE:
+        failed_lines.append(entry)
+
+
+class _PDFLoadError(Exception):
+    """The PDF could not be opened or read while its pages were streamed."""
 
-class AdventureGuideParser:
 
-    COUNTRY_MAPPING = {
+# PyMuPDF, imported on first use by _load_fitz: its native extension is slow
+# to load and is not needed until a PDF is actually opened
+fitz: Optional[ModuleType] = None
+
+
+def _load_fitz() -> ModuleType:
+    """Import PyMuPDF on first use and return the module."""
+    global fitz
+    if fitz is None:
+        import fitz  # PyMuPDF
+    return cast(ModuleType, fitz)
+
+
+def _text_flags() -> int:
+    """
+    Plain-text extraction flags without ligature preservation.
+
+    Ligatures are expanded to plain letters, which is what the keyword lookup
+    expects.
+    """
+    pymupdf = _load_fitz()
+    return int(pymupdf.TEXTFLAGS_TEXT & ~pymupdf.TEXT_PRESERVE_LIGATURES)
+
+
+def _extract_pages(pdf_path: Path, start: int, stop: int) -> List[str]:
+    """
+    Extract the text of pages ``start`` to ``stop - 1``.
+
+    MuPDF documents cannot be shared between workers, so each call opens its
+    own handle on the file.
+    """
+    flags = _text_flags()
+    with _load_fitz().open(pdf_path) as doc:
+        return [
+            doc.load_page(i).get_text("text", flags=flags) for i in range(start, stop)
+        ]
+
+
+COUNTRY_MAPPING = MappingProxyType(
+    {
         # Europe
         "NORWAY": {"country": "Norway", "region": "Scandinavia"},
         "SWEDEN": {"country": "Sweden", "region": "Scandinavia"},
@@ -85,6 +226,8 @@ class AdventureGuideParser:
         "PERU": {"country": "Peru", "region": "South America"},
         "BOLIVIA": {"country": "Bolivia", "region": "South America"},
         "CHILE": {"country": "Chile", "region": "South America"},
+        # Keywords match whole words, so adjectival forms need their own entry
+        "CHILEAN": {"country": "Chile", "region": "South America"},
         "ARGENTINA": {"country": "Argentina", "region": "South America"},
         # Asia
         "CHINA": {"country": "China", "region": "East Asia"},
@@ -129,6 +272,7 @@ class AdventureGuideParser:
         # Africa
         "MOROCCO": {"country": "Morocco", "region": "North Africa"},
         "ALGERIA": {"country": "Algeria", "region": "North Africa"},
+        "ALGERIAN": {"country": "Algeria", "region": "North Africa"},
         "TUNISIA": {"country": "Tunisia", "region": "North Africa"},
         "EGYPT": {"country": "Egypt", "region": "North Africa"},
         "SENEGAL": {"country": "Senegal", "region": "West Africa"},
@@ -174,8 +318,10 @@ class AdventureGuideParser:
         "BALEARIC": {"country": "Spain", "region": "Southern Europe"},
         "CANARY": {"country": "Spain", "region": "Atlantic Islands"},
     }
+)
 
-    SPECIAL_CASES = {
+SPECIAL_CASES = MappingProxyType(
+    {
         "GEOGRAPHICAL NORTH POLE": {"country": "Arctic", "region": "North Pole"},
         "BOTH POLES": {"country": "Multiple", "region": "Global"},
         "WORLDWIDE": {"country": "Multiple", "region": "Global"},
@@ -195,8 +341,55 @@ class AdventureGuideParser:
         "PATAGONIA": {"country": "Multiple", "region": "South America"},
         "FRENCH RIVIERA": {"country": "France", "region": "Western Europe"},
     }
+)
 
-    CHAPTERS = {
+# Landscape features used when no keyword names the place outright
+FEATURE_KEYWORDS = MappingProxyType(
+    {
+        ("ISLAND", "ISLANDS", "ARCHIPELAGO"): "Islands",
+        ("DESERT", "SEA", "OCEAN", "BAY", "GULF"): "Maritime Region",
+        ("MOUNTAIN", "MOUNTAINS", "ALPS", "HIMALAYA", "HIMALAYAS"): "Mountain Region",
+        ("RIVER", "LAKE", "FALLS"): "Water Feature",
+        ("NATIONAL PARK", "RESERVE", "PARK"): "Protected Area",
+    }
+)
+
+# Every keyword flattened once, in lookup priority order (special cases,
+# then countries, then features); a lower index wins
+_LOOKUP = tuple(
+    (keyword, info["country"], info["region"])
+    for mapping in (SPECIAL_CASES, COUNTRY_MAPPING)
+    for keyword, info in mapping.items()
+) + tuple(
+    (keyword, "Multiple", region)
+    for keywords, region in FEATURE_KEYWORDS.items()
+    for keyword in keywords
+)
+
+# Single-word keywords are found by looking up each word of the location
+_WORD_RANKS = {
+    keyword: rank
+    for rank, (keyword, _, _) in reversed(list(enumerate(_LOOKUP)))
+    if WORD_PATTERN.fullmatch(keyword)
+}
+
+# Multi-word keywords go through one alternation with a group per entry.
+# Wrapping it in a lookahead lets finditer try every start position, so
+# a match's lastindex is always the best phrase starting there.
+_PHRASES = tuple(
+    (rank, keyword)
+    for rank, (keyword, _, _) in enumerate(_LOOKUP)
+    if not WORD_PATTERN.fullmatch(keyword)
+)
+_PHRASE_RANKS = tuple(rank for rank, _ in _PHRASES)
+_PHRASE_PATTERN = re.compile(
+    r"(?=\b(?:"
+    + "|".join(f"({re.escape(keyword)})" for _, keyword in _PHRASES)
+    + r")\b)"
+)
+
+CHAPTERS = MappingProxyType(
+    {
         1: {
             "title": "From 90° North to 60° North",
             "range": {"from": "90° North", "to": "60° North"},
@@ -238,31 +431,70 @@ class AdventureGuideParser:
             "ids": (930, 1000),
         },
     }
+)
 
-    def __init__(self):
-        self.pattern = re.compile(
-            r"(\d+)\.\s+(.+?)\s+-\s+Latitude:\s*([\d.-]+)\s*([NS])\s+Longitude:\s*([\d.-]+)\s*([EW])?"
-        )
+# (first id, last id, chapter) sorted by first id, for bisect lookups
+_CHAPTER_BOUNDS = tuple(sorted((*info["ids"], num) for num, info in CHAPTERS.items()))
+_CHAPTER_STARTS = tuple(start for start, _, _ in _CHAPTER_BOUNDS)
+
+
+@lru_cache(maxsize=4096)
+def _lookup_country_region(location_upper: str) -> Tuple[str, str]:
+    """Resolve an upper-cased location; memoized, as guides repeat places."""
+    ranks = [
+        _WORD_RANKS[word]
+        for word in WORD_PATTERN.findall(location_upper)
+        if word in _WORD_RANKS
+    ]
+    for m in _PHRASE_PATTERN.finditer(location_upper):
+        # Each match captures exactly one phrase group
+        assert m.lastindex is not None
+        ranks.append(_PHRASE_RANKS[m.lastindex - 1])
+    if ranks:
+        _, country, region = _LOOKUP[min(ranks)]
+        return country, region
+
+    if any(word in location_upper for word in ["MULTIPLE", "VARIOUS", "WORLDWIDE"]):
+        return "Multiple", "Multiple"
+
+    return "Unknown", "Unknown"
+
+
+class AdventureGuideParser:
+
+    # Read-only lookup tables, kept as class attributes for existing callers
+    COUNTRY_MAPPING = COUNTRY_MAPPING
+    SPECIAL_CASES = SPECIAL_CASES
+    FEATURE_KEYWORDS = FEATURE_KEYWORDS
+    CHAPTERS = CHAPTERS
+
+    def __init__(self, attraction_cache: Optional[Path] = None):
+        self.pattern = DESTINATION_PATTERN
         self.stats = {
             "processed": 0,
             "successful": 0,
             "failed": 0,
             "unknown_countries": 0,
         }
-        self.failed_lines = []  # Track failed lines for debugging
-        
-        # Initialize Ollama generator with default batch size of 5
-        self.ollama_generator = OllamaGenerator(batch_size=5)
+        self.failed_lines: List[str] = []  # Track failed lines for debugging
 
-    def generate_main_attractions(self, location: str, country: str, region: str) -> Tuple[str, str]:
+        # Initialize Ollama generator with default batch size of 5; attractions
+        # are reused across runs when a cache file is given
+        self.ollama_generator = OllamaGenerator(
+            batch_size=5, cache_path=attraction_cache
+        )
+
+    def generate_main_attractions(
+        self, location: str, country: str, region: str
+    ) -> Tuple[str, str]:
         """
         Generate main attractions in English and French using the dedicated Ollama generator.
-        
+
         Args:
             location: The location name
             country: The country name
             region: The region name
-            
+
         Returns:
             Tuple of (mainAttractionEn, mainAttractionFr)
         """
@@ -275,14 +507,68 @@ class AdventureGuideParser:
         if not line:
             return None
 
-        match = self.pattern.match(line)
-        if not match:
-            self.stats["failed"] += 1
-            self.failed_lines.append(line)  # Store failed line
+        fields = self._destination_fields(line)
+        if fields is None:
+            self._record_failure(line)
+            return None
+
+        return self.parse_fields(line, fields)
+
+    def _destination_fields(self, line: str) -> Optional[DestinationFields]:
+        """
+        Split a stripped line into destination fields, or None if it is not one.
+
+        Shared by ``parse_line`` and the page scan in ``parse_pdf_content``.
+        """
+        # Every destination line starts with its id and carries a latitude;
+        # checking that first skips the parsers for headers and near-misses
+        if not (line[:1].isdigit() and "Latitude:" in line):
+            return None
+
+        # Canonically spaced lines are split without the regex engine, which
+        # only handles irregular spacing
+        fields = _split_destination_line(line)
+        if fields is None:
+            match = self.pattern.match(line)
+            if match is None:
+                return None
+            fields = cast(DestinationFields, match.groups())
+        return fields
+
+    def _record_failure(self, entry: str) -> None:
+        """Count a failed line, keeping only the first few for the debug report."""
+        self.stats["failed"] += 1
+        _sample_failure(self.failed_lines, entry)
+
+    def parse_match(self, match: "re.Match[str]") -> Optional[Destination]:
+        """Build a destination from a match of ``DESTINATION_PATTERN``."""
+        fields = cast(DestinationFields, match.groups())
+        return self.parse_fields(match.group(0).strip(), fields)
+
+    def parse_fields(
+        self, line: str, fields: DestinationFields
+    ) -> Optional[Destination]:
+        """Build a destination from the raw fields of a destination line."""
+        result = self._build_destination(line, fields)
+        if isinstance(result, str):
+            self._record_failure(result)
             return None
 
+        self.stats["successful"] += 1
+        if result.country == "Unknown":
+            self.stats["unknown_countries"] += 1
+        return result
+
+    def _build_destination(
+        self, line: str, fields: DestinationFields
+    ) -> Union[Destination, str]:
+        """
+        Build a destination without touching the parser's statistics.
+
+        Returns the destination, or the entry to record in ``failed_lines``.
+        """
         try:
-            id_str, location, lat, lat_dir, lng, lng_dir = match.groups()
+            id_str, location, lat, lat_dir, lng, lng_dir = fields
 
             location = self.clean_location(location)
             coordinates = self.parse_coordinates(lat, lat_dir, lng, lng_dir)
@@ -291,15 +577,12 @@ class AdventureGuideParser:
                 -90 <= coordinates.latitude <= 90
                 and -180 <= coordinates.longitude <= 180
             ):
-                self.stats["failed"] += 1
-                self.failed_lines.append(f"Invalid coords: {line}")
-                return None
+                return f"Invalid coords: {line}"
 
+            # country/region are the string objects from the lookup tables, so
+            # all destinations share them; no per-destination copies or interning.
             country, region = self.identify_country_region(location)
 
-            if country == "Unknown":
-                self.stats["unknown_countries"] += 1
-
             # Generate Google Maps link
             google_maps_link = generate_google_maps_link(location, coordinates)
 
@@ -308,9 +591,11 @@ class AdventureGuideParser:
             extended_links = ExtendedLinks(**extended_links_dict)
 
             # Generate main attractions using Ollama
-            main_attraction_en, main_attraction_fr = self.generate_main_attractions(location, country, region)
+            main_attraction_en, main_attraction_fr = self.generate_main_attractions(
+                location, country, region
+            )
 
-            destination = Destination(
+            return Destination(
                 id=int(id_str),
                 location=location,
                 coordinates=coordinates,
@@ -322,14 +607,9 @@ class AdventureGuideParser:
                 extendedLinks=extended_links,
             )
 
-            self.stats["successful"] += 1
-            return destination
-
         except (ValueError, TypeError) as e:
-            logger.error(f"Parse error: {line} - {e}")
-            self.stats["failed"] += 1
-            self.failed_lines.append(f"Error: {line}")
-            return None
+            logger.error("Parse error: %s - %s", line, e)
+            return f"Error: {line}"
 
     def save_debug_report(self, output_dir: Path) -> None:
         """Save debug report with failed lines analysis"""
@@ -337,43 +617,35 @@ class AdventureGuideParser:
             return
 
         debug_report = {
+            "counting": STATS_SCOPE,
             "summary": self.stats,
             "success_rate": f"{(self.stats['successful'] / max(1, self.stats['processed'])) * 100:.1f}%",
-            "failed_lines_sample": self.failed_lines[:50],  # First 50 failed lines
-            "total_failed_lines": len(self.failed_lines),
+            "failed_lines_sample": self.failed_lines,  # First 50 failed lines
+            "total_failed_lines": self.stats["failed"],
         }
 
         debug_file = output_dir / "debug_report.json"
         try:
-            with open(debug_file, "w", encoding="utf-8") as f:
-                json.dump(debug_report, f, ensure_ascii=False, indent=2)
-            logger.info(f"Debug report saved: {debug_file}")
-            logger.info(f"   💾 Saved: {debug_file.name}")
+            write_json(debug_report, debug_file)
+            logger.info("Debug report saved: %s", debug_file)
+            logger.info("   💾 Saved: %s", debug_file.name)
         except Exception as e:
-            logger.error(f"Debug report error: {e}")
-            logger.error(f"   ❌ Debug report error: {e}")
+            logger.error("Debug report error: %s", e)
+            logger.error("   ❌ Debug report error: %s", e)
 
     def clean_location(self, location: str) -> str:
-        location = re.sub(r"\s+", " ", location.strip())
-        corrections = {
-            "SOLVENIA": "SLOVENIA",
-            "PAPAU NEW GUINEA": "PAPUA NEW GUINEA",
-            "TAJIKSTAN": "TAJIKISTAN",
-        }
-        for error, correction in corrections.items():
-            location = location.replace(error, correction)
-        return location
+        # str.split() collapses whitespace runs faster than a regex sub
+        location = " ".join(location.split())
+        return LOCATION_CORRECTIONS_PATTERN.sub(
+            lambda m: LOCATION_CORRECTIONS[m.group(0)], location
+        )
 
     def parse_coordinates(
-        self, lat: str, lat_dir: str, lng: str, lng_dir: str
+        self, lat: str, lat_dir: str, lng: str, lng_dir: Optional[str]
     ) -> Coordinates:
-        latitude = float(lat)
-        longitude = float(lng)
-
-        if lat_dir == "S":
-            latitude = -latitude
-        if lng_dir == "W":
-            longitude = -longitude
+        # Sign from hemisphere via (1 - 2 * is_negative), without branching
+        latitude = float(lat) * (1 - 2 * (lat_dir == "S"))
+        longitude = float(lng) * (1 - 2 * (lng_dir == "W"))
 
         return Coordinates(
             latitude=latitude,
@@ -383,82 +655,91 @@ class AdventureGuideParser:
         )
 
     def identify_country_region(self, location: str) -> Tuple[str, str]:
-        location_upper = location.upper().strip()
-
-        for special_key, info in self.SPECIAL_CASES.items():
-            if special_key in location_upper:
-                return info["country"], info["region"]
-
-        for keyword, info in self.COUNTRY_MAPPING.items():
-            if keyword in location_upper:
-                return info["country"], info["region"]
-
-        patterns = [
-            (r"\b(ISLAND|ISLANDS|ARCHIPELAGO)\b", "Multiple", "Islands"),
-            (r"\b(DESERT|SEA|OCEAN|BAY|GULF)\b", "Multiple", "Maritime Region"),
-            (r"\b(MOUNTAINS?|ALPS|HIMALAYAS?)\b", "Multiple", "Mountain Region"),
-            (r"\b(RIVER|LAKE|FALLS)\b", "Multiple", "Water Feature"),
-            (r"\b(NATIONAL PARK|RESERVE|PARK)\b", "Multiple", "Protected Area"),
-        ]
-
-        for pattern, country, region in patterns:
-            if re.search(pattern, location_upper):
-                return country, region
-
-        if "," in location_upper:
-            parts = [part.strip() for part in location_upper.split(",")]
-            potential_country = parts[-1]
-            potential_country = re.sub(
-                r"\b(PROVINCE|REGION|STATE|TERRITORY|GOVERNORATE)\b",
-                "",
-                potential_country,
-            ).strip()
-
-            for keyword, info in self.COUNTRY_MAPPING.items():
-                if keyword in potential_country:
-                    return info["country"], info["region"]
-
-        if any(word in location_upper for word in ["MULTIPLE", "VARIOUS", "WORLDWIDE"]):
-            return "Multiple", "Multiple"
+        # Matching works on whole words, so surrounding whitespace is
+        # irrelevant; clean_location has already collapsed it anyway
+        return _lookup_country_region(location.upper())
+
+    def chapter_for_id(self, destination_id: int) -> Optional[int]:
+        """Return the chapter whose id range holds ``destination_id``, if any."""
+        index = bisect_right(_CHAPTER_STARTS, destination_id) - 1
+        if index < 0:
+            return None
+        _, end_id, chapter_num = _CHAPTER_BOUNDS[index]
+        return chapter_num if destination_id <= end_id else None
 
-        return "Unknown", "Unknown"
+    def parse_pdf_content(
+        self, content: Union[str, Iterable[str]]
+    ) -> Dict[int, List[Destination]]:
+        """
+        Parse destinations from the guide text, given whole or page by page.
 
-    def parse_pdf_content(self, content: str) -> Dict[int, List[Destination]]:
-        lines = [line.strip() for line in content.split("\n") if line.strip()]
+        Only numbered entry lines ("<id>. ...") are examined, so the
+        ``processed`` and ``failed`` stats count those lines rather than every
+        line of the text (see ``STATS_SCOPE``); headers, page numbers and
+        wrapped continuation lines are skipped without being counted.
+        """
         chapters_data = {i: [] for i in range(1, 9)}
+        failed_lines: List[str] = []
+        self.failed_lines = failed_lines  # Reset failed lines
+
+        if isinstance(content, str):
+            logger.info("📖 Processing %s characters of content...", len(content))
+            content = (content,)
+        else:
+            logger.info("📖 Processing content page by page...")
+
+        # Counters are kept in locals and stored in self.stats once at the end
+        processed = successful = failed = unknown_countries = 0
+
+        # One linear scan per page for numbered lines instead of one match per
+        # line; a destination line never spans two pages
+        destination_fields = self._destination_fields
+        candidates = (
+            candidate.group(0).strip()
+            for page in content
+            for candidate in CANDIDATE_PATTERN.finditer(page)
+        )
+        for line in candidates:
+            if processed % 100 == 0 and processed > 0:
+                logger.info("   📊 Progress: %s destination lines", processed)
+
+            processed += 1
+            fields = destination_fields(line)
+            if fields is None:
+                failed += 1
+                _sample_failure(failed_lines, line)
+                continue
+
+            result = self._build_destination(line, fields)
+            if isinstance(result, str):
+                failed += 1
+                _sample_failure(failed_lines, result)
+                continue
+
+            successful += 1
+            unknown_countries += result.country == "Unknown"
+            chapter_num = self.chapter_for_id(result.id)
+            if chapter_num is not None:
+                chapters_data[chapter_num].append(result)
 
         self.stats = {
-            "processed": 0,
-            "successful": 0,
-            "failed": 0,
-            "unknown_countries": 0,
+            "processed": processed,
+            "successful": successful,
+            "failed": failed,
+            "unknown_countries": unknown_countries,
         }
-        self.failed_lines = []  # Reset failed lines
-
-        total_lines = len(lines)
-        logger.info(f"📖 Processing {total_lines} lines of content...")
-
-        for i, line in enumerate(lines):
-            if i % 100 == 0 and i > 0:
-                logger.info(f"   📊 Progress: {i}/{total_lines} lines ({i/total_lines*100:.1f}%)")
-
-            destination = self.parse_line(line)
-            if destination:
-                for chapter_num, chapter_info in self.CHAPTERS.items():
-                    start_id, end_id = chapter_info["ids"]
-                    if start_id <= destination.id <= end_id:
-                        chapters_data[chapter_num].append(destination)
-                        break
 
         # Process any remaining batch items
-        logger.info(f"🔄 Processing final batch of Ollama requests...")
+        logger.info("🔄 Processing final batch of Ollama requests...")
         self.ollama_generator.process_batch(force=True)
 
         # Update destinations with actual Ollama results
-        logger.info(f"🔄 Updating destinations with Ollama results...")
+        logger.info("🔄 Updating destinations with Ollama results...")
         for chapter_num, destinations in chapters_data.items():
             for destination in destinations:
-                en_result, fr_result = self.ollama_generator.get_attraction_result(destination.location)
+                en_result, fr_result = self.ollama_generator.get_attraction_result(
+                    destination.location
+                )
                 destination.mainAttractionEn = en_result
                 destination.mainAttractionFr = fr_result
 
@@ -466,41 +747,82 @@ class AdventureGuideParser:
             self.stats["successful"] / max(1, self.stats["processed"])
         ) * 100
         logger.info(
-            f"Processed: {self.stats['processed']}, Successful: {self.stats['successful']}, "
-            f"Failed: {self.stats['failed']}, Unknown countries: {self.stats['unknown_countries']}"
+            "Processed: %s, Successful: %s, Failed: %s, Unknown countries: %s",
+            self.stats["processed"],
+            self.stats["successful"],
+            self.stats["failed"],
+            self.stats["unknown_countries"],
         )
-        logger.info(f"Success rate: {success_rate:.1f}%")
+        logger.info("Success rate: %.1f%%", success_rate)
 
-        logger.info(f"✅ Content processing complete: {self.stats['processed']} lines processed")
-        logger.info(f"📊 Success rate: {success_rate:.1f}% ({self.stats['successful']}/{self.stats['processed']})")
+        logger.info(
+            "✅ Content processing complete: %s numbered entry lines processed",
+            self.stats["processed"],
+        )
+        logger.info(
+            "📊 Success rate: %.1f%% (%s/%s)",
+            success_rate,
+            self.stats["successful"],
+            self.stats["processed"],
+        )
 
         if self.failed_lines:
             logger.info("Failed lines sample (first 5):")
             for line in self.failed_lines[:5]:
-                logger.info(f"  {line}")
+                logger.info("  %s", line)
 
         return chapters_data
 
+    def iter_pages(self, pdf_path: Path) -> Iterator[str]:
+        """Yield the text of each page in order, one page at a time."""
+        flags = _text_flags()
+        # The context manager releases the file handle / mmap right away
+        with _load_fitz().open(pdf_path) as doc:
+            page_count = doc.page_count
+            if page_count < PARALLEL_PAGE_THRESHOLD:
+                for page in doc:
+                    yield page.get_text("text", flags=flags)
+                return
+
+        yield from self._extract_pages_parallel(pdf_path, page_count)
+
     def load_pdf(self, pdf_path: Path) -> str:
         try:
-            doc = fitz.open(pdf_path)
-            content = ""
-            total_pages = len(doc)
-            logger.info(f"   📄 Loading {total_pages} pages...")
-            
-            for page_num, page in enumerate(doc):
-                if page_num % 10 == 0 and page_num > 0:
-                    logger.info(f"      📊 Page progress: {page_num}/{total_pages} ({page_num/total_pages*100:.1f}%)")
-                content += page.get_text() + "\n"
-            
-            doc.close()
-            logger.info(f"   ✅ PDF loaded successfully: {len(content)} characters")
+            pages = list(self.iter_pages(pdf_path))
+            logger.info("   📄 Loaded %s pages", len(pages))
+            content = "".join(f"{text}\n" for text in pages)
+            logger.info("   ✅ PDF loaded successfully: %s characters", len(content))
             return content
         except Exception as e:
-            logger.error(f"Failed to load PDF: {e}")
-            logger.error(f"   ❌ Failed to load PDF: {e}")
+            logger.error("Failed to load PDF: %s", e)
+            logger.error("   ❌ Failed to load PDF: %s", e)
             return ""
 
+    def _iter_pages_checked(self, pdf_path: Path) -> Iterator[str]:
+        """
+        Yield the pages like ``iter_pages``, wrapping read errors.
+
+        Whatever PyMuPDF raises while opening or reading the file becomes a
+        ``_PDFLoadError``, so ``process_pdf`` can tell a bad PDF apart from a
+        parsing error and log it instead of raising, as ``load_pdf`` does.
+        """
+        try:
+            yield from self.iter_pages(pdf_path)
+        except Exception as e:
+            raise _PDFLoadError(e) from e
+
+    def _extract_pages_parallel(self, pdf_path: Path, page_count: int) -> Iterator[str]:
+        """Extract page texts across worker processes, yielding them in page order."""
+        workers = min(os.cpu_count() or 1, page_count)
+        step = -(-page_count // workers)  # ceil division
+        starts = range(0, page_count, step)
+        stops = [min(start + step, page_count) for start in starts]
+
+        logger.info("   ⚡ Extracting %s pages with %s workers", page_count, workers)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk in executor.map(_extract_pages, repeat(pdf_path), starts, stops):
+                yield from chunk
+
     def create_chapter_json(
         self, chapter_num: int, destinations: List[Destination]
     ) -> Chapter:
@@ -523,13 +845,12 @@ class AdventureGuideParser:
 
     def save_json(self, data: Chapter, output_path: Path) -> None:
         try:
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(asdict(data), f, ensure_ascii=False, indent=2)
-            logger.info(f"Saved: {output_path}")
-            logger.info(f"   💾 Saved: {output_path.name}")
+            write_json(data, output_path)
+            logger.info("Saved: %s", output_path)
+            logger.info("   💾 Saved: %s", output_path.name)
         except Exception as e:
-            logger.error(f"Save error: {e}")
-            logger.error(f"   ❌ Save error: {e}")
+            logger.error("Save error: %s", e)
+            logger.error("   ❌ Save error: %s", e)
 
     def create_combined_json(
         self, chapters_data: Dict[int, List[Destination]], output_dir: Path
@@ -557,66 +878,98 @@ class AdventureGuideParser:
                     "title": chapter_info["title"],
                     "latitudeRange": chapter_info["range"],
                     "destinationCount": len(destinations),
-                    "destinations": [asdict(dest) for dest in destinations],
+                    # Serialized directly by write_json, no asdict copies
+                    "destinations": destinations,
                 }
 
         output_file = output_dir / "complete_adventure_guide.json"
         try:
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(combined_data, f, ensure_ascii=False, indent=2)
-            logger.info(f"Complete guide saved: {output_file}")
-            logger.info(f"   💾 Saved: {output_file.name}")
+            write_json(combined_data, output_file)
+            logger.info("Complete guide saved: %s", output_file)
+            logger.info("   💾 Saved: %s", output_file.name)
         except Exception as e:
-            logger.error(f"Combined JSON error: {e}")
-            logger.error(f"   ❌ Combined JSON error: {e}")
+            logger.error("Combined JSON error: %s", e)
+            logger.error("   ❌ Combined JSON error: %s", e)
 
     def process_pdf(self, pdf_path: Path, output_dir: Path) -> None:
         try:
-            logger.info(f"📄 Loading PDF: {pdf_path}")
-            logger.info(f"Processing: {pdf_path}")
-
-            content = self.load_pdf(pdf_path)
-            if not content:
-                logger.error("Failed to load PDF content")
+            logger.info("📄 Loading PDF: %s", pdf_path)
+            logger.info("Processing: %s", pdf_path)
+
+            # Pages are parsed as they are extracted, so the whole document
+            # text is never held in memory at once
+            logger.info("🔍 Parsing PDF content...")
+            try:
+                chapters_data = self.parse_pdf_content(
+                    self._iter_pages_checked(pdf_path)
+                )
+            except _PDFLoadError as e:
+                logger.error("Failed to load PDF: %s", e)
                 logger.error("❌ Failed to load PDF content")
                 return
-
-            logger.info(f"🔍 Parsing PDF content...")
-            chapters_data = self.parse_pdf_content(content)
-            total_destinations = sum(len(destinations) for destinations in chapters_data.values())
-            logger.info(f"✅ Found {total_destinations} destinations across {len(chapters_data)} chapters")
+            total_destinations = sum(
+                len(destinations) for destinations in chapters_data.values()
+            )
+            logger.info(
+                "✅ Found %s destinations across %s chapters",
+                total_destinations,
+                len(chapters_data),
+            )
 
             output_dir.mkdir(parents=True, exist_ok=True)
-            logger.info(f"📁 Output directory: {output_dir}")
-
-            logger.info(f"💾 Saving chapter files...")
-            for chapter_num, destinations in chapters_data.items():
-                if destinations:
-                    chapter_json = self.create_chapter_json(chapter_num, destinations)
-                    output_file = (
-                        output_dir / f"chapter_{chapter_num}_destinations.json"
+            logger.info("📁 Output directory: %s", output_dir)
+
+            logger.info("💾 Saving chapter files...")
+            chapter_nums = [num for num, dests in chapters_data.items() if dests]
+            chapters = [
+                self.create_chapter_json(num, chapters_data[num])
+                for num in chapter_nums
+            ]
+            output_files = [
+                output_dir / f"chapter_{num}_destinations.json" for num in chapter_nums
+            ]
+            # Overlap all output writes; each writer handles its own errors
+            with ThreadPoolExecutor(max_workers=JSON_WRITE_WORKERS) as executor:
+                writes = [
+                    executor.submit(self.save_json, chapter, output_file)
+                    for chapter, output_file in zip(chapters, output_files)
+                ]
+                logger.info("🔗 Creating combined JSON file...")
+                writes.append(
+                    executor.submit(
+                        self.create_combined_json, chapters_data, output_dir
                     )
-                    self.save_json(chapter_json, output_file)
-                    logger.info(f"   📄 Chapter {chapter_num}: {len(destinations)} destinations")
-
-            logger.info(f"🔗 Creating combined JSON file...")
-            self.create_combined_json(chapters_data, output_dir)
-            logger.info(f"✅ Combined JSON file created")
-
+                )
+                if self.failed_lines:
+                    logger.info(
+                        "🐛 Saving debug report (%s failed lines)...",
+                        self.stats["failed"],
+                    )
+                    writes.append(executor.submit(self.save_debug_report, output_dir))
+                for write in writes:
+                    write.result()
+
+            for chapter in chapters:
+                logger.info(
+                    "   📄 Chapter %s: %s destinations",
+                    chapter.metadata["chapter"],
+                    chapter.totalDestinations,
+                )
+            logger.info("✅ Combined JSON file created")
             if self.failed_lines:
-                logger.info(f"🐛 Saving debug report ({len(self.failed_lines)} failed lines)...")
-                self.save_debug_report(output_dir)
-                logger.info(f"✅ Debug report saved")
+                logger.info("✅ Debug report saved")
 
-            logger.info(f"🎉 Processing complete! Total destinations: {total_destinations}")
             logger.info(
-                f"Processing complete! Total destinations: {total_destinations}"
+                "🎉 Processing complete! Total destinations: %s", total_destinations
+            )
+            logger.info(
+                "Processing complete! Total destinations: %s", total_destinations
             )
-            logger.info(f"Files saved to: {output_dir.absolute()}")
+            logger.info("Files saved to: %s", output_dir.absolute())
 
         except Exception as e:
-            logger.error(f"Processing error: {e}")
-            logger.error(f"❌ Error processing PDF: {e}")
+            logger.error("Processing error: %s", e)
+            logger.error("❌ Error processing PDF: %s", e)
             raise
 
     def get_stats(self) -> dict:
@@ -3,22 +3,42 @@ Utility functions and helpers.
 """
 
 from .coordinates import (
+    apply_hemisphere_signs,
     calculate_distance,
+    calculate_distances_bulk,
     decimal_to_dms,
+    distances_from,
     format_coordinates,
     get_coordinate_bounds,
+    nearest_coordinates,
     validate_coordinates,
 )
-from .file_io import backup_file, ensure_directory, get_file_size, load_json, save_json
+from .file_io import (
+    backup_file,
+    dumps_json,
+    ensure_directory,
+    get_file_size,
+    load_json,
+    loads_json,
+    save_json,
+    write_json,
+)
 
 __all__ = [
     "calculate_distance",
+    "calculate_distances_bulk",
+    "distances_from",
     "validate_coordinates",
     "format_coordinates",
     "decimal_to_dms",
     "get_coordinate_bounds",
+    "nearest_coordinates",
+    "apply_hemisphere_signs",
+    "dumps_json",
     "save_json",
+    "write_json",
     "load_json",
+    "loads_json",
     "ensure_directory",
     "get_file_size",
     "backup_file",
@@ -1,13 +1,31 @@
 """Utility functions for coordinate operations."""
 
+import heapq
 import logging
 import math
-from typing import List, Tuple
+from typing import List, MutableSequence, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
 
 from find_your_next_adventure.models import Coordinates
 
 logger = logging.getLogger(__name__)
 
+# Mean Earth radius in kilometers
+EARTH_RADIUS_KM = 6371.0
+
+
+def _haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Haversine distance in kilometers between two points given in radians."""
+    # The sine form stays accurate for nearby points, where 1 - cos(x) cancels
+    sin_dlat = math.sin((lat2 - lat1) / 2.0)
+    sin_dlon = math.sin((lon2 - lon1) / 2.0)
+    a = sin_dlat * sin_dlat + math.cos(lat1) * math.cos(lat2) * sin_dlon * sin_dlon
+    return EARTH_RADIUS_KM * 2.0 * math.atan2(math.sqrt(a), math.sqrt(1.0 - a))
+
 
 def calculate_distance(coord1: Coordinates, coord2: Coordinates) -> float:
     """
@@ -20,25 +38,135 @@ def calculate_distance(coord1: Coordinates, coord2: Coordinates) -> float:
     Returns:
         Distance in kilometers
     """
-    # Convert to radians
-    lat1 = math.radians(coord1.latitude)
-    lon1 = math.radians(coord1.longitude)
-    lat2 = math.radians(coord2.latitude)
-    lon2 = math.radians(coord2.longitude)
-
-    # Haversine formula
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
-    a = (
-        math.sin(dlat / 2) ** 2
-        + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
+    radians = math.radians
+    return _haversine_km(
+        radians(coord1.latitude),
+        radians(coord1.longitude),
+        radians(coord2.latitude),
+        radians(coord2.longitude),
     )
-    c = 2 * math.asin(math.sqrt(a))
 
-    # Earth's radius in kilometers
-    earth_radius = 6371.0
 
-    return earth_radius * c
+def calculate_distances_bulk(
+    lat1: Sequence[float],
+    lon1: Sequence[float],
+    lat2: Sequence[float],
+    lon2: Sequence[float],
+) -> Sequence[float]:
+    """
+    Calculate Haversine distances for many coordinate pairs at once.
+
+    Takes columns of degrees, such as latitude and longitude arrays, and
+    returns the distance between each pair of rows. With NumPy installed the
+    formula runs as vectorized ufuncs over the whole batch (and inputs may
+    broadcast, e.g. ``lat1[:, None]`` against ``lat2`` for a distance matrix);
+    otherwise it falls back to a single pure-Python loop.
+
+    Args:
+        lat1: Latitudes of the first points
+        lon1: Longitudes of the first points
+        lat2: Latitudes of the second points
+        lon2: Longitudes of the second points
+
+    Returns:
+        Distances in kilometers (a NumPy array when NumPy is installed)
+    """
+    if np is not None:
+        phi1 = np.radians(np.asarray(lat1, dtype=np.float64))
+        lam1 = np.radians(np.asarray(lon1, dtype=np.float64))
+        phi2 = np.radians(np.asarray(lat2, dtype=np.float64))
+        lam2 = np.radians(np.asarray(lon2, dtype=np.float64))
+        # Same sine form as _haversine_km
+        sin_dlat = np.sin((phi2 - phi1) / 2.0)
+        sin_dlon = np.sin((lam2 - lam1) / 2.0)
+        a = sin_dlat**2 + np.cos(phi1) * np.cos(phi2) * sin_dlon**2
+        distances: Sequence[float] = (
+            EARTH_RADIUS_KM * 2.0 * np.arctan2(np.sqrt(a), np.sqrt(1.0 - a))
+        )
+        return distances
+
+    radians = math.radians
+    return list(
+        map(
+            _haversine_km,
+            map(radians, lat1),
+            map(radians, lon1),
+            map(radians, lat2),
+            map(radians, lon2),
+        )
+    )
+
+
+def distances_from(
+    origin: Coordinates, latitudes: Sequence[float], longitudes: Sequence[float]
+) -> Sequence[float]:
+    """
+    Calculate Haversine distances from one point to a column of points.
+
+    The origin's radians and cosine are computed once rather than once per
+    pair, so a one-to-many query costs two sines and a cosine per candidate.
+
+    Args:
+        origin: Point to measure from
+        latitudes: Latitudes of the other points, in degrees
+        longitudes: Longitudes of the other points, in degrees
+
+    Returns:
+        Distances in kilometers (a NumPy array when NumPy is installed)
+    """
+    lat0 = math.radians(origin.latitude)
+    lon0 = math.radians(origin.longitude)
+    cos_lat0 = math.cos(lat0)
+
+    if np is not None:
+        lat = np.radians(np.asarray(latitudes, dtype=np.float64))
+        lon = np.radians(np.asarray(longitudes, dtype=np.float64))
+        sin_dlat = np.sin((lat - lat0) / 2.0)
+        sin_dlon = np.sin((lon - lon0) / 2.0)
+        a = sin_dlat**2 + cos_lat0 * np.cos(lat) * sin_dlon**2
+        result: Sequence[float] = (
+            EARTH_RADIUS_KM * 2.0 * np.arctan2(np.sqrt(a), np.sqrt(1.0 - a))
+        )
+        return result
+
+    radians, sin, cos = math.radians, math.sin, math.cos
+    atan2, sqrt = math.atan2, math.sqrt
+    distances = []
+    for lat, lon in zip(map(radians, latitudes), map(radians, longitudes)):
+        sin_dlat = sin((lat - lat0) / 2.0)
+        sin_dlon = sin((lon - lon0) / 2.0)
+        a = sin_dlat * sin_dlat + cos_lat0 * cos(lat) * sin_dlon * sin_dlon
+        distances.append(EARTH_RADIUS_KM * 2.0 * atan2(sqrt(a), sqrt(1.0 - a)))
+    return distances
+
+
+def nearest_coordinates(
+    query: Coordinates, coordinates: Sequence[Coordinates], k: int = 1
+) -> List[Tuple[float, int]]:
+    """
+    Find the coordinates closest to a query point.
+
+    Distances to every candidate are computed in one distances_from call, and
+    only the ``k`` best are kept with a bounded heap instead of sorting the
+    whole list.
+
+    Args:
+        query: Point to search around
+        coordinates: Candidate points
+        k: Number of neighbours to return
+
+    Returns:
+        List of (distance in kilometers, index into coordinates), nearest first
+    """
+    if not coordinates or k <= 0:
+        return []
+
+    distances = distances_from(
+        query,
+        [coord.latitude for coord in coordinates],
+        [coord.longitude for coord in coordinates],
+    )
+    return heapq.nsmallest(k, zip(map(float, distances), range(len(coordinates))))
 
 
 def validate_coordinates(latitude: float, longitude: float) -> bool:
@@ -89,10 +217,27 @@ def decimal_to_dms(decimal_degrees: float) -> Tuple[int, int, float]:
     Returns:
         Tuple of (degrees, minutes, seconds)
     """
-    degrees = int(decimal_degrees)
-    minutes = int((decimal_degrees - degrees) * 60)
-    seconds = ((decimal_degrees - degrees) * 60 - minutes) * 60
-    return degrees, minutes, seconds
+    fraction, degrees = math.modf(decimal_degrees)
+    fraction, minutes = math.modf(fraction * 60)
+    return int(degrees), int(minutes), fraction * 60
+
+
+def apply_hemisphere_signs(
+    values: MutableSequence[float], directions: Sequence[str], negative: str
+) -> None:
+    """
+    Negate, in place, every value whose hemisphere matches ``negative``.
+
+    Works on whole columns (e.g. ``array('d')`` latitudes) so the sign
+    fix-up is one pass over the batch rather than one branch per Coordinates.
+
+    Args:
+        values: Unsigned coordinate values, modified in place
+        directions: Hemisphere letter for each value
+        negative: Hemisphere that maps to negative values ("S" or "W")
+    """
+    for i, direction in enumerate(directions):
+        values[i] *= 1 - 2 * (direction == negative)
 
 
 def get_coordinate_bounds(coordinates: List[Coordinates]) -> dict:
@@ -2,11 +2,120 @@
 
 import json
 import logging
+import shutil
+from dataclasses import fields, is_dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Union
+
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Buffer size for streamed JSON writes (64 KiB)
+JSON_WRITE_BUFFER_SIZE = 1 << 16
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize models (via ``to_dict``) and dataclasses for the stdlib encoder."""
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is not None:
+        return to_dict()
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _orjson_dumps(data: Any, indent: Optional[int]) -> Optional[bytes]:
+    """
+    Encode data with orjson, or return None when the stdlib encoder must be used.
+
+    orjson is skipped when it is not installed, for indents it cannot produce,
+    and for data it rejects (e.g. objects it cannot serialize natively).
+    """
+    if orjson is None or indent not in (None, 2):
+        return None
+    option = orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    try:
+        encoded: bytes = orjson.dumps(data, option=option)
+    except TypeError as e:
+        logger.debug("orjson could not encode data, using json: %s", e)
+        return None
+    return encoded
+
+
+def dumps_json(data: Any, indent: Optional[int] = 2) -> bytes:
+    """
+    Serialize data to UTF-8 encoded JSON.
+
+    Dataclasses are serialized directly, without an intermediate ``asdict`` copy.
+    Uses orjson when it is installed and the standard library otherwise;
+    note that orjson writes NaN and infinity as ``null``.
+
+    Args:
+        data: Data to serialize
+        indent: JSON indentation level (None for compact output)
+
+    Returns:
+        The encoded JSON document
+    """
+    encoded = _orjson_dumps(data, indent)
+    if encoded is not None:
+        return encoded
+
+    return json.dumps(
+        data, ensure_ascii=False, indent=indent, default=_json_default
+    ).encode("utf-8")
+
+
+def loads_json(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document, using orjson when it is installed.
+
+    Args:
+        data: Encoded JSON document
+
+    Returns:
+        The decoded data
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_json(
+    data: Any, file_path: Union[str, Path], indent: Optional[int] = 2
+) -> None:
+    """
+    Write data to a UTF-8 JSON file.
+
+    With orjson the document is encoded once and written in a single call.
+    Otherwise the stdlib encoder's chunks are streamed through one buffered
+    file object, so the full document is never held in memory as a string.
+    Errors are propagated to the caller.
+
+    Args:
+        data: Data to write (dataclasses are supported)
+        file_path: Path of the file to write
+        indent: JSON indentation level (None for compact output)
+    """
+    encoded = _orjson_dumps(data, indent)
+    if encoded is not None:
+        with open(file_path, "wb") as f:
+            f.write(encoded)
+        return
+
+    encoder = json.JSONEncoder(ensure_ascii=False, indent=indent, default=_json_default)
+    with open(file_path, "w", encoding="utf-8", buffering=JSON_WRITE_BUFFER_SIZE) as f:
+        for chunk in encoder.iterencode(data):
+            f.write(chunk)
+
 
 def save_json(data: Any, file_path: Union[str, Path], indent: int = 2) -> bool:
     """
@@ -24,8 +133,7 @@ def save_json(data: Any, file_path: Union[str, Path], indent: int = 2) -> bool:
         file_path = Path(file_path)
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=indent)
+        write_json(data, file_path, indent)
 
         logger.info(f"Successfully saved JSON to: {file_path}")
         return True
@@ -47,17 +155,14 @@ def load_json(file_path: Union[str, Path]) -> Union[Dict, List, None]:
     """
     try:
         file_path = Path(file_path)
-
-        if not file_path.exists():
-            logger.error(f"JSON file not found: {file_path}")
-            return None
-
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = loads_json(file_path.read_bytes())
 
         logger.info(f"Successfully loaded JSON from: {file_path}")
         return data
 
+    except FileNotFoundError:
+        logger.error(f"JSON file not found: {file_path}")
+        return None
     except json.JSONDecodeError as e:
         logger.error(f"Invalid JSON in {file_path}: {e}")
         return None
@@ -114,20 +219,18 @@ def backup_file(file_path: Union[str, Path], backup_suffix: str = ".backup") ->
     """
     try:
         file_path = Path(file_path)
-
-        if not file_path.exists():
-            logger.warning(f"Cannot backup non-existent file: {file_path}")
-            return False
-
         backup_path = file_path.with_suffix(file_path.suffix + backup_suffix)
 
-        # Copy file content
-        with open(file_path, "rb") as src, open(backup_path, "wb") as dst:
-            dst.write(src.read())
+        # Copy file content (kernel-side where the platform supports it)
+        shutil.copyfile(file_path, backup_path)
 
         logger.info(f"Created backup: {backup_path}")
         return True
 
+    except FileNotFoundError:
+        logger.warning(f"Cannot backup non-existent file: {file_path}")
+        return False
+
     except Exception as e:
         logger.error(f"Failed to backup {file_path}: {e}")
         return False
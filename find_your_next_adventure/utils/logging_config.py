@@ -2,12 +2,20 @@
 Centralized logging configuration for the Find Your Next Adventure application.
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
+
+# Banner line framing session start/end blocks
+SEPARATOR = "=" * 60
+
+# Background listener that writes queued records to the real handlers
+_listener: Optional[logging.handlers.QueueListener] = None
 
 
 def setup_logging(
@@ -15,11 +23,14 @@ def setup_logging(
     log_level: int = logging.INFO,
     max_bytes: int = 10 * 1024 * 1024,  # 10MB
     backup_count: int = 5,
-    console_output: bool = True
+    console_output: bool = True,
 ) -> None:
     """
     Set up centralized logging configuration for the entire application.
-    
+
+    Loggers only enqueue records; a QueueListener thread does the file and
+    console writes, so logging calls never block on I/O.
+
     Args:
         log_file: Name of the log file (default: find_your_next_adventure.log)
         log_level: Logging level (default: INFO)
@@ -30,58 +41,79 @@ def setup_logging(
     # Create logs directory if it doesn't exist
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
-    
+
     # Full path to log file
     log_path = log_dir / log_file
-    
+
     # Create formatter
     formatter = logging.Formatter(
-        fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
+        fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
     )
-    
+
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
-    
+
     # Clear any existing handlers to avoid duplicates
+    stop_logging()
     root_logger.handlers.clear()
-    
+    handlers: List[logging.Handler] = []
+
     # File handler with rotation
     file_handler = logging.handlers.RotatingFileHandler(
-        log_path,
-        maxBytes=max_bytes,
-        backupCount=backup_count,
-        encoding='utf-8'
+        log_path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
     )
     file_handler.setLevel(log_level)
     file_handler.setFormatter(formatter)
-    root_logger.addHandler(file_handler)
-    
+    handlers.append(file_handler)
+
     # Console handler (optional)
     if console_output:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(log_level)
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
-    
+        handlers.append(console_handler)
+
+    # Hand records to the handlers through a queue drained by a background thread
+    global _listener
+    log_queue: queue.Queue = queue.Queue(-1)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _listener.start()
+
     # Log the setup
     logger = logging.getLogger(__name__)
-    logger.info(f"Logging configured - File: {log_path}, Level: {logging.getLevelName(log_level)}")
-    
+    logger.info(
+        "Logging configured - File: %s, Level: %s",
+        log_path,
+        logging.getLevelName(log_level),
+    )
+
     # Suppress overly verbose logs from third-party libraries
-    logging.getLogger('urllib3').setLevel(logging.WARNING)
-    logging.getLogger('requests').setLevel(logging.WARNING)
-    logging.getLogger('PIL').setLevel(logging.WARNING)
+    logging.getLogger("urllib3").setLevel(logging.WARNING)
+    logging.getLogger("requests").setLevel(logging.WARNING)
+    logging.getLogger("PIL").setLevel(logging.WARNING)
+
+
+@atexit.register
+def stop_logging() -> None:
+    """Flush queued log records and stop the background listener."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
 
 
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger with the specified name.
-    
+
     Args:
         name: Logger name (usually __name__)
-        
+
     Returns:
         Configured logger instance
     """
@@ -91,34 +123,34 @@ def get_logger(name: str) -> logging.Logger:
 def log_session_start(session_info: dict) -> None:
     """
     Log session start information.
-    
+
     Args:
         session_info: Dictionary containing session information
     """
     logger = logging.getLogger(__name__)
-    logger.info("=" * 60)
+    logger.info(SEPARATOR)
     logger.info("SESSION STARTED")
-    logger.info("=" * 60)
-    
+    logger.info(SEPARATOR)
+
     for key, value in session_info.items():
-        logger.info(f"{key}: {value}")
-    
-    logger.info("=" * 60)
+        logger.info("%s: %s", key, value)
+
+    logger.info(SEPARATOR)
 
 
 def log_session_end(stats: dict) -> None:
     """
     Log session end information with statistics.
-    
+
     Args:
         stats: Dictionary containing session statistics
     """
     logger = logging.getLogger(__name__)
-    logger.info("=" * 60)
+    logger.info(SEPARATOR)
     logger.info("SESSION ENDED")
-    logger.info("=" * 60)
-    
+    logger.info(SEPARATOR)
+
     for key, value in stats.items():
-        logger.info(f"{key}: {value}")
-    
-    logger.info("=" * 60) 
\ No newline at end of file
+        logger.info("%s: %s", key, value)
+
+    logger.info(SEPARATOR)
@@ -3,13 +3,29 @@
 import logging
 import re
 import urllib.parse
+from datetime import datetime
 from enum import Enum
-from typing import Dict, Union
+from functools import lru_cache
+from typing import Dict, Optional, Union
 
 from find_your_next_adventure.models.coordinates import Coordinates
 
 logger = logging.getLogger(__name__)
 
+# Leading qualifiers and trailing country names stripped from search queries;
+# the anchors keep the two alternatives at opposite ends of the string
+LOCATION_AFFIX_PATTERN = re.compile(
+    r"^(?:START IN|START AT|START WITH|NEAR|ALL OVER|ACROSS|INCLUDES)\s+"
+    r"|,?\s+(?:US|UK|USA|UNITED STATES|UNITED KINGDOM)$",
+    re.IGNORECASE,
+)
+PUNCTUATION_PATTERN = re.compile(r"[,;]+")
+
+# URL-encoding of location names, memoized because the same name is encoded
+# for several link families (queries that embed coordinates are not cached)
+_quote = lru_cache(maxsize=4096)(urllib.parse.quote)
+_quote_plus = lru_cache(maxsize=4096)(urllib.parse.quote_plus)
+
 
 class ImageSize(Enum):
     """Standard image sizes for various services"""
@@ -29,10 +45,19 @@ class MapType(Enum):
     TERRAIN = "terrain"
 
 
+def _clamp(value: int, low: int, high: int) -> int:
+    """Clamp value to [low, high] with comparisons instead of min()/max() calls."""
+    return low if value < low else high if value > high else value
+
+
+@lru_cache(maxsize=2048)
 def clean_location_name(location: str) -> str:
     """
     Clean and normalize location name for better search results
 
+    Results are memoized, since the same location is cleaned for several link
+    families.
+
     Args:
         location: Raw location string
 
@@ -40,22 +65,11 @@ def clean_location_name(location: str) -> str:
         Cleaned location string
     """
     # Remove common prefixes and suffixes
-    location = re.sub(
-        r"^(START IN|START AT|START WITH|NEAR|ALL OVER|ACROSS|INCLUDES)\s+",
-        "",
-        location,
-        flags=re.IGNORECASE,
-    )
-    location = re.sub(
-        r",?\s+(US|UK|USA|UNITED STATES|UNITED KINGDOM)$",
-        "",
-        location,
-        flags=re.IGNORECASE,
-    )
+    location = LOCATION_AFFIX_PATTERN.sub("", location)
 
     # Clean up extra spaces and punctuation
-    location = re.sub(r"\s+", " ", location)
-    location = re.sub(r"[,;]+", ",", location)
+    location = " ".join(location.split())
+    location = PUNCTUATION_PATTERN.sub(",", location)
     location = location.strip(" ,.-")
 
     return location
@@ -82,7 +96,7 @@ def generate_google_maps_link(location: str, coordinates: Coordinates) -> str:
 
     # Add zoom level for better initial view (15 is good for city/landmark level)
     result = f"{base_url}{encoded_query},15z"
-    logger.debug(f"Generated Google Maps link for {location}: {result}")
+    logger.debug("Generated Google Maps link for %s: %s", location, result)
     return result
 
 
@@ -113,7 +127,7 @@ def generate_apple_maps_link(location: str, coordinates: Coordinates) -> str:
         An Apple Maps URL string
     """
     # Apple Maps format
-    query = urllib.parse.quote(location)
+    query = _quote(location)
     return f"https://maps.apple.com/?q={query}&ll={coordinates.latitude},{coordinates.longitude}"
 
 
@@ -143,26 +157,32 @@ def generate_google_street_view_link(
     # Format: https://www.google.com/maps/@lat,lng,zoom,heading,tilt,fov
     zoom = "3a"  # Street View zoom level
     heading = heading % 360
-    pitch = max(-90, min(90, pitch))
-    fov = max(10, min(120, fov))
+    pitch = _clamp(pitch, -90, 90)
+    fov = _clamp(fov, 10, 120)
 
     return f"https://www.google.com/maps/@{lat},{lng},{zoom},{heading}y,{pitch}h,{fov}t/data=!3m1!1e3"
 
 
-def generate_google_places_photo_link(location: str, coordinates: Coordinates) -> str:
+def generate_google_places_photo_link(
+    location: str,
+    coordinates: Coordinates,
+    cleaned_location: Optional[str] = None,
+) -> str:
     """
     Generate Google Places photo search link
 
     Args:
         location: Location name
         coordinates: Coordinates object
+        cleaned_location: Precomputed clean_location_name(location), if any
 
     Returns:
         Google Images search URL for the location
     """
-    clean_location = clean_location_name(location)
-    search_query = f"{clean_location} travel destination photography"
-    encoded_query = urllib.parse.quote_plus(search_query)
+    if cleaned_location is None:
+        cleaned_location = clean_location_name(location)
+    search_query = f"{cleaned_location} travel destination photography"
+    encoded_query = _quote_plus(search_query)
 
     return f"https://www.google.com/search?q={encoded_query}&tbm=isch&tbs=sur:fmc"
 
@@ -235,7 +255,9 @@ def generate_satellite_view_links(
 
 
 def generate_alternative_image_sources(
-    location: str, coordinates: Coordinates
+    location: str,
+    coordinates: Coordinates,
+    cleaned_location: Optional[str] = None,
 ) -> Dict[str, str]:
     """
     Generate alternative image sources for the location
@@ -243,12 +265,14 @@ def generate_alternative_image_sources(
     Args:
         location: Location name
         coordinates: Coordinates object
+        cleaned_location: Precomputed clean_location_name(location), if any
 
     Returns:
         Dictionary of alternative image source URLs
     """
-    clean_location = clean_location_name(location)
-    encoded_location = urllib.parse.quote_plus(clean_location)
+    if cleaned_location is None:
+        cleaned_location = clean_location_name(location)
+    encoded_location = _quote_plus(cleaned_location)
 
     return {
         "unsplash": f"https://unsplash.com/s/photos/{encoded_location}",
@@ -261,20 +285,26 @@ def generate_alternative_image_sources(
     }
 
 
-def generate_panoramic_links(location: str, coordinates: Coordinates) -> Dict[str, str]:
+def generate_panoramic_links(
+    location: str,
+    coordinates: Coordinates,
+    cleaned_location: Optional[str] = None,
+) -> Dict[str, str]:
     """
     Generate panoramic and 360° view links (no API keys required)
 
     Args:
         location: Location name
         coordinates: Coordinates object
+        cleaned_location: Precomputed clean_location_name(location), if any
 
     Returns:
         Dictionary of panoramic view URLs
     """
     lat, lng = coordinates.latitude, coordinates.longitude
-    clean_location = clean_location_name(location)
-    encoded_location = urllib.parse.quote_plus(clean_location)
+    if cleaned_location is None:
+        cleaned_location = clean_location_name(location)
+    encoded_location = _quote_plus(cleaned_location)
 
     return {
         "google_street_view": generate_google_street_view_link(
@@ -313,29 +343,34 @@ def generate_location_image_links(
         raise TypeError("Coordinates must be a Coordinates object")
 
     lat, lng = coordinates.latitude, coordinates.longitude
+    cleaned_location = clean_location_name(location)
+    google_maps = f"https://maps.google.com/?q={lat},{lng}&z={custom_zoom}"
+    satellite_views = generate_satellite_view_links(location, coordinates)
 
     # Generate all link categories
     result = {
         # Primary map and street view links (no API keys)
         "primary": {
             "street_view": generate_google_street_view_link(location, coordinates),
-            "google_maps": f"https://maps.google.com/?q={lat},{lng}&z={custom_zoom}",
-            "google_earth": generate_google_earth_link(location, coordinates),
-            "satellite_view": f"https://www.google.com/maps/@{lat},{lng},1000m/data=!3m1!1e3",
+            "google_maps": google_maps,
+            "google_earth": satellite_views["google_earth_web"],
+            "satellite_view": satellite_views["google_satellite"],
         },
         # Multiple satellite providers (no API keys)
-        "satellite_views": generate_satellite_view_links(location, coordinates),
+        "satellite_views": satellite_views,
         # Static map alternatives (no API keys)
         "static_maps": generate_static_map_alternatives(
             location, coordinates, custom_zoom
         ),
         # Photo search engines
         "photo_search": {
-            "google_images": generate_google_places_photo_link(location, coordinates),
+            "google_images": generate_google_places_photo_link(
+                location, coordinates, cleaned_location
+            ),
         },
         # Interactive maps from different providers
         "interactive_maps": {
-            "google_maps": f"https://maps.google.com/?q={lat},{lng}&z={custom_zoom}",
+            "google_maps": google_maps,
             "openstreetmap": f"https://www.openstreetmap.org/?mlat={lat}&mlon={lng}&zoom={custom_zoom}",
             "apple_maps": f"https://maps.apple.com/?ll={lat},{lng}&z={custom_zoom}",
             "bing_maps": f"https://www.bing.com/maps?cp={lat}~{lng}&lvl={custom_zoom}",
@@ -344,10 +379,10 @@ def generate_location_image_links(
         },
         # Metadata
         "metadata": {
-            "location_cleaned": clean_location_name(location),
+            "location_cleaned": cleaned_location,
             "coordinates_dms": f"{abs(coordinates.latitude):.4f}°{coordinates.latitudeDirection}, {abs(coordinates.longitude):.4f}°{coordinates.longitudeDirection}",
             "coordinates_decimal": (coordinates.latitude, coordinates.longitude),
-            "generation_timestamp": __import__("datetime").datetime.now().isoformat(),
+            "generation_timestamp": datetime.now().isoformat(),
         },
     }
 
@@ -357,10 +392,12 @@ def generate_location_image_links(
             {
                 # Alternative image sources
                 "stock_photos": generate_alternative_image_sources(
-                    location, coordinates
+                    location, coordinates, cleaned_location
                 ),
                 # Panoramic and 360° views
-                "panoramic": generate_panoramic_links(location, coordinates),
+                "panoramic": generate_panoramic_links(
+                    location, coordinates, cleaned_location
+                ),
             }
         )
 
@@ -389,6 +426,6 @@ def generate_extended_links(location: str, coordinates: Coordinates) -> Dict[str
         "openStreetMap": generate_openstreetmap_link(location, coordinates),
         "appleMaps": generate_apple_maps_link(location, coordinates),
     }
-    
-    logger.debug(f"Generated extended links for {location}: {len(result)} links")
+
+    logger.debug("Generated extended links for %s: %s links", location, len(result))
     return result
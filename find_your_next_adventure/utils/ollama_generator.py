@@ -5,396 +5,632 @@ Ollama text generation utilities for the adventure guide parser.
 
 import datetime
 import logging
+import os
 import re
-from typing import Dict, List, Tuple
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Set, Tuple, Union, cast
 
-import ollama
+from .file_io import load_json, write_json
 
 logger = logging.getLogger(__name__)
 
+# Common (English, French) patterns for bilingual responses, each with the
+# lower-case markers both patterns need, checked before running the regexes
+BILINGUAL_PATTERNS = tuple(
+    (
+        en_marker.lower(),
+        fr_marker.lower(),
+        re.compile(rf"{en_marker}\s*(.*?)(?={fr_marker}|$)", re.DOTALL | re.IGNORECASE),
+        re.compile(rf"{fr_marker}\s*(.*?)$", re.DOTALL | re.IGNORECASE),
+    )
+    for en_marker, fr_marker in (
+        # Pattern: "English: ... French: ..."
+        ("English:", "French:"),
+        # Pattern: "EN: ... FR: ..."
+        ("EN:", "FR:"),
+        # Pattern: "English: ... Français: ..."
+        ("English:", "Français:"),
+        # Pattern: "🇬🇧 ... 🇫🇷 ..."
+        ("🇬🇧", "🇫🇷"),
+    )
+)
+
+# Tokens allowed per location in a batch answer: a "Name: English: ... |
+# French: ..." line with one or two sentences in each language
+TOKENS_PER_LOCATION = 120
+
+# New cached answers after which the attraction cache is written mid-run
+CACHE_SAVE_INTERVAL = 25
+
+# Batches sent to Ollama at once unless OLLAMA_CONCURRENCY says otherwise
+DEFAULT_CONCURRENCY = 4
+
+# How long Ollama keeps the model loaded after a request, so pauses between
+# batches (e.g. while the PDF is read) do not trigger a reload
+KEEP_ALIVE = "30m"
+
+# Prompt sent for each batch; {locations} is one "- Name (Country, Region)"
+# line per location and {count} the number of locations
+BATCH_PROMPT_TEMPLATE = """Generate brief, engaging descriptions of the main attractions for these travel destinations.
+
+Locations:
+{locations}
+
+For each location, provide the response in this exact format:
+[Location Name]: English: [Brief description in English] | French: [Brief description in French]
+
+Keep each description concise (1-2 sentences) and focus on what makes each destination unique and appealing to travelers.
+
+Please provide exactly {count} responses, one for each location listed above.
+
+Example format:
+Paris: English: Discover the iconic Eiffel Tower and charming cafes along the Seine River | French: Découvrez la tour Eiffel emblématique et les charmants cafés le long de la Seine
+Tokyo: English: Experience the blend of ancient temples and cutting-edge technology in this vibrant metropolis | French: Vivez le mélange de temples anciens et de technologie de pointe dans cette métropole vibrante"""
+
+# The ollama client, imported on first use by _load_ollama: importing it
+# takes a few hundred milliseconds and it is only needed to call the model
+ollama: Optional[ModuleType] = None
+
+
+def _preview(text: str, limit: int = 80) -> str:
+    """Truncate text for log output, marking any cut with an ellipsis."""
+    return text[:limit] + "..." if text[limit : limit + 1] else text
+
+
+def _concurrency_from_env() -> int:
+    """Read OLLAMA_CONCURRENCY, falling back to the default unless it is >= 1."""
+    value = os.environ.get("OLLAMA_CONCURRENCY")
+    if value is None:
+        return DEFAULT_CONCURRENCY
+    try:
+        workers = int(value)
+    except ValueError:
+        workers = 0
+    if workers < 1:
+        logger.warning(
+            "Invalid OLLAMA_CONCURRENCY %r, using %d", value, DEFAULT_CONCURRENCY
+        )
+        return DEFAULT_CONCURRENCY
+    return workers
+
+
+def _load_ollama() -> ModuleType:
+    """Import the ollama client on first use and return the module."""
+    global ollama
+    if ollama is None:
+        import ollama
+    return cast(ModuleType, ollama)
+
 
 class OllamaGenerator:
     """Dedicated class for generating text using Ollama with phi4-mini model."""
 
-    def __init__(self, model: str = "phi4-mini", batch_size: int = 5):
+    def __init__(
+        self,
+        model: Optional[str] = None,
+        batch_size: int = 5,
+        max_workers: Optional[int] = None,
+        cache_path: Optional[Union[str, Path]] = None,
+    ):
         """
         Initialize the Ollama generator.
-        
+
         Args:
-            model: The Ollama model to use (default: phi4-mini)
+            model: The Ollama model to use (default: the OLLAMA_MODEL environment
+                variable, or phi4-mini)
             batch_size: Number of locations to process in each batch (default: 5)
+            max_workers: Number of batches sent to Ollama concurrently
+                (default: the OLLAMA_CONCURRENCY environment variable, or 4)
+            cache_path: JSON file keeping generated attractions between runs
+                (default: None, no persistent cache)
         """
-        self.model = model
+        self.model = model or os.environ.get("OLLAMA_MODEL", "phi4-mini")
         self.batch_size = batch_size
+        if max_workers is None:
+            max_workers = _concurrency_from_env()
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: List[Future] = []
+        # Serializes stats updates and logging from the batch worker threads
+        self._lock = threading.Lock()
+        # Created up front: worker threads write results concurrently
+        self.batch_queue: List[dict] = []
+        self.batch_results: Dict[str, Tuple[str, str]] = {}
+        # Cache keys already queued this run, so duplicates share one answer
+        self._queued: Set[str] = set()
+
+        # Attractions from earlier runs, keyed by "model|location|country|region"
+        self.cache_path = Path(cache_path) if cache_path else None
+        self._cache: Dict[str, List[str]] = {}
+        # Answers added to the cache since it was last written
+        self._unsaved = 0
+        if self.cache_path is not None and self.cache_path.exists():
+            cached = load_json(self.cache_path)
+            if isinstance(cached, dict):
+                self._cache = cached
+                logger.info("📦 Loaded %d cached attractions", len(self._cache))
+            elif cached is not None:
+                logger.warning(
+                    "Ignoring attraction cache %s: expected a JSON object",
+                    self.cache_path,
+                )
         self.options = {
-            'temperature': 0.7,
-            'top_p': 0.9,
-            'max_tokens': 200  # Increased for bilingual response
+            "temperature": 0.7,
+            "top_p": 0.9,
+            # Decode budget: one bilingual 1-2 sentence answer per location
+            "num_predict": TOKENS_PER_LOCATION * batch_size,
         }
         self.session_started = False
-        self.stats = {
-            'total_calls': 0,
-            'successful_calls': 0,
-            'error_calls': 0,
-            'start_time': None
+        # Session start on the monotonic clock, for cheap elapsed-time checks
+        self._start_monotonic: Optional[float] = None
+        self.stats: Dict[str, Any] = {
+            "total_calls": 0,
+            "successful_calls": 0,
+            "error_calls": 0,
+            "start_time": None,
         }
 
     def _create_session_header(self):
         """Create a session header for the log file."""
         try:
-            timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            self.stats['start_time'] = datetime.datetime.now()
-            
-            session_info = f"Ollama session started | Model: {self.model} | Batch Size: {self.batch_size} | Temp: {self.options.get('temperature', 'N/A')} | Max Tokens: {self.options.get('max_tokens', 'N/A')}"
-            
-            logger.info(f"🚀 {session_info}")
-            logger.info(f"📋 {session_info}")
+            self.stats["start_time"] = datetime.datetime.now()
+            self._start_monotonic = time.monotonic()
+
+            logger.info(
+                "🚀 Ollama session started | Model: %s | Batch Size: %s"
+                " | Temp: %s | Max Tokens: %s",
+                self.model,
+                self.batch_size,
+                self.options.get("temperature", "N/A"),
+                self.options.get("num_predict", "N/A"),
+            )
             self.session_started = True
-            
-        except Exception as e:
-            logger.error(f"❌ Failed to create session header: {e}")
 
-    def _append_to_log(self, location: str, prompt: str, response: str, en_result: str, fr_result: str):
-        """
-        Log Ollama generation details using centralized logging.
-        
-        Args:
-            location: The location being processed
-            prompt: The prompt sent to Ollama
-            response: The raw response from Ollama
-            en_result: The extracted English result
-            fr_result: The extracted French result
-        """
-        try:
-            timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-            
-            # Update stats
-            self.stats['total_calls'] += 1
-            self.stats['successful_calls'] += 1
-            
-            # Truncate long responses for readability
-            en_preview = en_result[:80] + "..." if len(en_result) > 80 else en_result
-            fr_preview = fr_result[:80] + "..." if len(fr_result) > 80 else fr_result
-            
-            # Console output with progress
-            elapsed = (datetime.datetime.now() - self.stats['start_time']).total_seconds() if self.stats['start_time'] else 0
-            success_rate = (self.stats['successful_calls'] / self.stats['total_calls'] * 100) if self.stats['total_calls'] > 0 else 0
-            
-            logger.info(f"✅ [{timestamp}] {location} | EN: {en_preview}")
-            logger.info(f"   📊 Progress: {self.stats['total_calls']} calls | {success_rate:.1f}% success | {elapsed:.1f}s elapsed")
-            
-            # Log using centralized logging
-            logger.info(f"[{timestamp}] {location} | EN: {en_preview} | FR: {fr_preview}")
-                
-            logger.info(f"✅ {location}: {en_preview}")
-            
         except Exception as e:
-            logger.error(f"❌ Failed to append to log file: {e}")
+            logger.error("❌ Failed to create session header: %s", e)
 
-    def _append_error_to_log(self, location: str, error: Exception, fallback_en: str, fallback_fr: str):
+    def _append_error_to_log(
+        self, batch: List[dict], error: Exception, fallbacks: List[Tuple[str, str]]
+    ) -> None:
         """
-        Log error details using centralized logging.
-        
+        Log a failed batch and its fallback descriptions as a single record.
+
         Args:
-            location: The location being processed
+            batch: The batch items that failed
             error: The exception that occurred
-            fallback_en: The fallback English description
-            fallback_fr: The fallback French description
+            fallbacks: The fallback (English, French) description per item
         """
         try:
-            timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-            
-            # Update stats
-            self.stats['total_calls'] += 1
-            self.stats['error_calls'] += 1
-            
-            # Truncate fallback responses
-            en_preview = fallback_en[:80] + "..." if len(fallback_en) > 80 else fallback_en
-            fr_preview = fallback_fr[:80] + "..." if len(fallback_fr) > 80 else fallback_fr
-            
-            # Console output with error details
-            elapsed = (datetime.datetime.now() - self.stats['start_time']).total_seconds() if self.stats['start_time'] else 0
-            success_rate = (self.stats['successful_calls'] / self.stats['total_calls'] * 100) if self.stats['total_calls'] > 0 else 0
-            
-            logger.warning(f"❌ [{timestamp}] {location} | ERROR: {type(error).__name__} | FALLBACK: {en_preview}")
-            logger.info(f"   📊 Progress: {self.stats['total_calls']} calls | {success_rate:.1f}% success | {elapsed:.1f}s elapsed")
-            
-            # Log using centralized logging
-            logger.warning(f"[{timestamp}] {location} | ERROR: {type(error).__name__} | FALLBACK EN: {en_preview} | FALLBACK FR: {fr_preview}")
-            
+            timestamp = time.strftime("%H:%M:%S")
+            error_name = type(error).__name__
+
+            # Update stats (one failed call per location)
+            self.stats["total_calls"] += len(batch)
+            self.stats["error_calls"] += len(batch)
+            if not logger.isEnabledFor(logging.WARNING):
+                return
+
+            lines = [
+                f"❌ [{timestamp}] Batch failed: {len(batch)} locations"
+                f" | ERROR: {error_name}"
+            ]
+            for item, (fallback_en, fallback_fr) in zip(batch, fallbacks):
+                lines.append(
+                    f"   {item['location']} | FALLBACK EN: {_preview(fallback_en)}"
+                    f" | FALLBACK FR: {_preview(fallback_fr)}"
+                )
+
+            # Progress summary
+            elapsed = self._elapsed()
+            success_rate = (
+                (self.stats["successful_calls"] / self.stats["total_calls"] * 100)
+                if self.stats["total_calls"] > 0
+                else 0
+            )
+            lines.append(
+                f"   📊 Progress: {self.stats['total_calls']} calls"
+                f" | {success_rate:.1f}% success | {elapsed:.1f}s elapsed"
+            )
+
+            logger.warning("\n".join(lines))
+
         except Exception as e:
-            logger.error(f"❌ Failed to log error: {e}")
+            logger.error("❌ Failed to log error: %s", e)
+
+    def _elapsed(self) -> float:
+        """Seconds since the session header was written (0 before that)."""
+        if self._start_monotonic is None:
+            return 0
+        return time.monotonic() - self._start_monotonic
 
     def get_stats(self) -> dict:
         """
         Get current generation statistics.
-        
+
         Returns:
             Dictionary with generation statistics
         """
-        if self.stats['start_time']:
-            elapsed = (datetime.datetime.now() - self.stats['start_time']).total_seconds()
-            avg_time = elapsed / self.stats['total_calls'] if self.stats['total_calls'] > 0 else 0
-            success_rate = (self.stats['successful_calls'] / self.stats['total_calls'] * 100) if self.stats['total_calls'] > 0 else 0
-            
+        if self.stats["start_time"]:
+            elapsed = self._elapsed()
+            avg_time = (
+                elapsed / self.stats["total_calls"]
+                if self.stats["total_calls"] > 0
+                else 0
+            )
+            success_rate = (
+                (self.stats["successful_calls"] / self.stats["total_calls"] * 100)
+                if self.stats["total_calls"] > 0
+                else 0
+            )
+
             return {
-                'total_calls': self.stats['total_calls'],
-                'successful_calls': self.stats['successful_calls'],
-                'error_calls': self.stats['error_calls'],
-                'success_rate': success_rate,
-                'elapsed_time': elapsed,
-                'avg_time_per_call': avg_time
+                "total_calls": self.stats["total_calls"],
+                "successful_calls": self.stats["successful_calls"],
+                "error_calls": self.stats["error_calls"],
+                "success_rate": success_rate,
+                "elapsed_time": elapsed,
+                "avg_time_per_call": avg_time,
             }
         return self.stats
 
     def print_final_stats(self):
         """Print final generation statistics to console."""
         stats = self.get_stats()
-        
-        logger.info("\n" + "="*60)
+
+        logger.info("\n" + "=" * 60)
         logger.info("📊 OLLAMA GENERATION STATISTICS")
-        logger.info("="*60)
-        logger.info(f"🎯 Total Calls: {stats['total_calls']}")
-        logger.info(f"✅ Successful: {stats['successful_calls']}")
-        logger.info(f"❌ Errors: {stats['error_calls']}")
-        logger.info(f"📈 Success Rate: {stats['success_rate']:.1f}%")
-        logger.info(f"⏱️  Total Time: {stats['elapsed_time']:.1f}s")
-        logger.info(f"⚡ Avg Time/Call: {stats['avg_time_per_call']:.2f}s")
-        logger.info(f"📦 Batch Size: {self.batch_size}")
-        logger.info("="*60)
-
-    def generate_attractions(self, location: str, country: str, region: str) -> Tuple[str, str]:
+        logger.info("=" * 60)
+        logger.info("🎯 Total Calls: %s", stats["total_calls"])
+        logger.info("✅ Successful: %s", stats["successful_calls"])
+        logger.info("❌ Errors: %s", stats["error_calls"])
+        logger.info("📈 Success Rate: %.1f%%", stats["success_rate"])
+        logger.info("⏱️  Total Time: %.1fs", stats["elapsed_time"])
+        logger.info("⚡ Avg Time/Call: %.2fs", stats["avg_time_per_call"])
+        logger.info("📦 Batch Size: %s", self.batch_size)
+        logger.info("=" * 60)
+
+    def generate_attractions(
+        self, location: str, country: str, region: str
+    ) -> Tuple[str, str]:
         """
         Generate main attractions in English and French for a location.
         This method now supports batching - it will queue the request and return immediately.
         Use process_batch() to actually generate the attractions.
-        
+
         Args:
             location: The location name
             country: The country name
             region: The region name
-            
+
         Returns:
             Tuple of (mainAttractionEn, mainAttractionFr) - will be placeholders until batch is processed
         """
-        # Add to batch queue
-        self._add_to_batch(location, country, region)
-        
+        # Reuse attractions generated by an earlier run
+        key = self._cache_key(location, country, region)
+        cached = self._cache.get(key)
+        if cached:
+            en_result, fr_result = cached
+            self.batch_results[location] = (en_result, fr_result)
+            return en_result, fr_result
+
+        # Add to batch queue, once per distinct location
+        if key not in self._queued:
+            self._queued.add(key)
+            self._add_to_batch(location, country, region)
+
         # Return placeholder values - will be replaced after batch processing
         return f"Processing {location}...", f"Traitement de {location}..."
-    
+
+    def _cache_key(self, location: str, country: str, region: str) -> str:
+        """Build the persistent cache key for a location and the current model."""
+        return f"{self.model}|{location}|{country}|{region}"
+
+    @staticmethod
+    def _fallback_result(location: str, country: str) -> Tuple[str, str]:
+        """Generic attractions used when Ollama gives no usable answer."""
+        return (
+            f"Discover the unique charm and attractions of {location} in {country}.",
+            f"Découvrez le charme unique et les attractions de {location} en {country}.",
+        )
+
     def _add_to_batch(self, location: str, country: str, region: str):
-        """Add a location to the current batch."""
-        if not hasattr(self, 'batch_queue'):
-            self.batch_queue = []
-            
-        self.batch_queue.append({
-            'location': location,
-            'country': country,
-            'region': region
-        })
-        
+        """Add a location to the current batch (callers skip duplicates)."""
+        self.batch_queue.append(
+            {"location": location, "country": country, "region": region}
+        )
+
         # Process batch if it reaches the size limit
         if len(self.batch_queue) >= self.batch_size:
             self.process_batch()
-    
+
     def process_batch(self, force: bool = False):
         """
-        Process the current batch of locations.
-        
+        Send queued locations to Ollama.
+
+        Full batches are sent in the background on a thread pool, so parsing
+        carries on while Ollama works; the network and model latency of up to
+        ``max_workers`` batches overlaps.
+
         Args:
-            force: If True, process the batch even if it's not full
+            force: If True, also send a partial batch and wait until every
+                batch sent so far has finished
         """
-        if not hasattr(self, 'batch_queue') or not self.batch_queue:
-            return
-            
-        if not force and len(self.batch_queue) < self.batch_size:
+        while len(self.batch_queue) >= self.batch_size or (force and self.batch_queue):
+            self._submit_batch()
+
+        if force:
+            self.wait_for_batches()
+
+    def wait_for_batches(self) -> None:
+        """Block until every batch sent to Ollama has been processed."""
+        pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        if self._unsaved:
+            self.save_cache()
+
+    def save_cache(self) -> None:
+        """
+        Write the attraction cache to ``cache_path``, if one is configured.
+
+        The file is written next to the cache and renamed over it, so a crash
+        mid-write never leaves a truncated cache behind.
+        """
+        if self.cache_path is None:
             return
-            
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+            with self._lock:
+                write_json(self._cache, temp_path)
+                os.replace(temp_path, self.cache_path)
+                self._unsaved = 0
+            logger.info("💾 Saved %d cached attractions", len(self._cache))
+        except Exception as e:
+            logger.error("❌ Failed to save attraction cache: %s", e)
+
+    def _submit_batch(self) -> None:
+        """Take the next batch off the queue and run it on the thread pool."""
         if not self.session_started:
             self._create_session_header()
-        
-        batch = self.batch_queue[:self.batch_size]  # Process up to batch_size items
-        self.batch_queue = self.batch_queue[self.batch_size:]  # Remove processed items
-        
-        logger.info(f"🔄 Processing {len(batch)} locations in single prompt...")
-        
+
+        batch = self.batch_queue[: self.batch_size]  # Process up to batch_size items
+        self.batch_queue = self.batch_queue[self.batch_size :]  # Remove processed items
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="ollama"
+            )
+        self._pending.append(self._executor.submit(self._run_batch, batch))
+
+    def _run_batch(self, batch: List[dict]) -> None:
+        """Generate attractions for one batch with a single Ollama call."""
+        logger.info("🔄 Processing %d locations in single prompt...", len(batch))
+
         try:
             # Create a single prompt for the entire batch
             batch_prompt = self._create_batch_prompt(batch)
-            
+
             # Call Ollama once for the entire batch
-            logger.info(f"   📤 Sending single prompt with {len(batch)} locations to Ollama...")
-            response = ollama.generate(
-                model=self.model,
-                prompt=batch_prompt,
-                options=self.options
+            logger.info(
+                "   📤 Sending single prompt with %d locations to Ollama...",
+                len(batch),
             )
-            
+            response = self._stream_batch_response(batch_prompt, batch)
+
             # Parse the batch response
-            results = self._parse_batch_response(response['response'], batch)
-            
+            results = self._parse_batch_response(response, batch)
+
             # Log the batch generation
-            self._append_batch_to_log(batch, batch_prompt, response['response'], results)
-            
-            # Store results for retrieval
-            if not hasattr(self, 'batch_results'):
-                self.batch_results = {}
-            
-            for location, (en_result, fr_result) in results.items():
-                self.batch_results[location] = (en_result, fr_result)
-            
-            logger.info(f"   ✅ Successfully processed {len(results)} locations in single API call")
-                
+            with self._lock:
+                self._append_batch_to_log(batch, batch_prompt, response, results)
+
+            # Store results for retrieval; only real answers are cached
+            for item in batch:
+                location = item["location"]
+                if location in results:
+                    self.batch_results[location] = results[location]
+                    key = self._cache_key(location, item["country"], item["region"])
+                    with self._lock:
+                        self._cache[key] = list(results[location])
+                        self._unsaved += 1
+                else:
+                    self.batch_results[location] = self._fallback_result(
+                        location, item["country"]
+                    )
+
+            # Checkpoint regularly so a crash keeps the answers paid for so far
+            if self._unsaved >= CACHE_SAVE_INTERVAL:
+                self.save_cache()
+
+            logger.info(
+                "   ✅ Successfully processed %d locations in single API call",
+                len(results),
+            )
+
         except Exception as e:
-            logger.error(f"Batch Ollama generation error: {e}")
-            logger.error(f"❌ Batch processing error: {e}")
-            
+            logger.error("❌ Batch processing error: %s", e)
+
             # Create fallback results for the entire batch
+            fallbacks = []
             for item in batch:
-                location = item['location']
-                country = item['country']
-                fallback_en = f"Discover the unique charm and attractions of {location} in {country}."
-                fallback_fr = f"Découvrez le charme unique et les attractions de {location} en {country}."
-                
-                if not hasattr(self, 'batch_results'):
-                    self.batch_results = {}
-                self.batch_results[location] = (fallback_en, fallback_fr)
-                
-                self._append_error_to_log(location, e, fallback_en, fallback_fr)
-    
+                location = item["location"]
+                fallback = self._fallback_result(location, item["country"])
+                self.batch_results[location] = fallback
+                fallbacks.append(fallback)
+
+            with self._lock:
+                self._append_error_to_log(batch, e, fallbacks)
+
+    def _stream_batch_response(self, prompt: str, batch: List[dict]) -> str:
+        """
+        Stream a batch answer from Ollama, stopping once it is complete.
+
+        Generation is cut off as soon as the completed lines answer every
+        location in the batch, so any closing remarks the model adds are never
+        decoded. Echoed examples and malformed lines do not count as answers.
+        """
+        stream = _load_ollama().generate(
+            model=self.model,
+            prompt=prompt,
+            options=self.options,
+            stream=True,
+            keep_alive=KEEP_ALIVE,
+        )
+        chunks: List[str] = []
+        try:
+            for chunk in stream:
+                text = chunk["response"]
+                chunks.append(text)
+                if "\n" in text:
+                    # Check answers on completed lines only
+                    completed = "".join(chunks).rpartition("\n")[0]
+                    answered = self._parse_batch_response(completed, batch)
+                    if len(answered) >= len(batch):
+                        break
+        finally:
+            # Closing the stream drops the connection, which stops generation
+            close = getattr(stream, "close", None)
+            if close is not None:
+                close()
+        return "".join(chunks)
+
     def _create_batch_prompt(self, batch: List[dict]) -> str:
         """Create a prompt for processing multiple locations at once."""
-        locations_text = "\n".join([
+        locations = "\n".join(
             f"- {item['location']} ({item['country']}, {item['region']})"
             for item in batch
-        ])
-        
-        return f"""Generate brief, engaging descriptions of the main attractions for these travel destinations.
-
-Locations:
-{locations_text}
+        )
+        return BATCH_PROMPT_TEMPLATE.format(locations=locations, count=len(batch))
 
-For each location, provide the response in this exact format:
-[Location Name]: English: [Brief description in English] | French: [Brief description in French]
+    def _parse_batch_response(
+        self, response: str, batch: List[dict]
+    ) -> Dict[str, Tuple[str, str]]:
+        """
+        Parse the batch response to extract individual location results.
 
-Keep each description concise (1-2 sentences) and focus on what makes each destination unique and appealing to travelers.
+        Locations the response does not answer are left out.
+        """
+        lines = [line.strip() for line in response.strip().split("\n")]
 
-Please provide exactly {len(batch)} responses, one for each location listed above.
+        # Index the answered lines by their "Location:" prefix in one pass;
+        # the first well-formed line for a location wins
+        answers: Dict[str, Tuple[str, str]] = {}
+        for line in lines:
+            location, _, rest = line.partition(":")
+            if location not in answers:
+                parsed = self._parse_answer(rest)
+                if parsed:
+                    answers[location] = parsed
 
-Example format:
-Paris: English: Discover the iconic Eiffel Tower and charming cafes along the Seine River | French: Découvrez la tour Eiffel emblématique et les charmants cafés le long de la Seine
-Tokyo: English: Experience the blend of ancient temples and cutting-edge technology in this vibrant metropolis | French: Vivez le mélange de temples anciens et de technologie de pointe dans cette métropole vibrante"""
-    
-    def _parse_batch_response(self, response: str, batch: List[dict]) -> Dict[str, Tuple[str, str]]:
-        """Parse the batch response to extract individual location results."""
         results = {}
-        
-        # Split response into lines and process each line
-        lines = response.strip().split('\n')
-        
         for item in batch:
-            location = item['location']
-            country = item['country']
-            
-            # Look for the location in the response lines
-            found = False
-            for line in lines:
-                line = line.strip()
-                if line.startswith(f"{location}:"):
-                    # Parse the line: "Location: English: ... | French: ..."
-                    parts = line.split("English:", 1)
-                    if len(parts) == 2:
-                        french_part = parts[1].split("| French:", 1)
-                        if len(french_part) == 2:
-                            en_result = french_part[0].strip()
-                            fr_result = french_part[1].strip()
-                            results[location] = (en_result, fr_result)
-                            found = True
+            location = item["location"]
+            if location in answers:
+                results[location] = answers[location]
+            elif ":" in location:
+                # The prefix index splits such names; scan for them directly
+                prefix = f"{location}:"
+                for line in lines:
+                    if line.startswith(prefix):
+                        parsed = self._parse_answer(line[len(prefix) :])
+                        if parsed:
+                            results[location] = parsed
                             break
-            
-            if not found:
-                # Fallback if parsing fails
-                en_result = f"Discover the unique charm and attractions of {location} in {country}."
-                fr_result = f"Découvrez le charme unique et les attractions de {location} en {country}."
-                results[location] = (en_result, fr_result)
-        
+
         return results
-    
-    def _append_batch_to_log(self, batch: List[dict], prompt: str, response: str, results: Dict[str, Tuple[str, str]]):
+
+    @staticmethod
+    def _parse_answer(answer: str) -> Optional[Tuple[str, str]]:
+        """Split " English: ... | French: ..." into its two texts, if well-formed."""
+        parts = answer.split("English:", 1)
+        if len(parts) == 2:
+            french_part = parts[1].split("| French:", 1)
+            if len(french_part) == 2:
+                return french_part[0].strip(), french_part[1].strip()
+        return None
+
+    def _append_batch_to_log(
+        self,
+        batch: List[dict],
+        prompt: str,
+        response: str,
+        results: Dict[str, Tuple[str, str]],
+    ):
         """Log batch generation results."""
         try:
-            timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-            
+            timestamp = time.strftime("%H:%M:%S")
+
             # Update stats
-            self.stats['total_calls'] += 1
-            self.stats['successful_calls'] += 1
-            
-            # Console output with more details
-            logger.info(f"✅ [{timestamp}] Batch processed: {len(batch)} locations in single prompt")
-            
-            # Show sample results
-            sample_locations = list(results.keys())[:3]
-            for location in sample_locations:
+            self.stats["total_calls"] += 1
+            self.stats["successful_calls"] += 1
+            if not logger.isEnabledFor(logging.INFO):
+                return
+
+            # Batch summary and sample results, emitted as one record
+            lines = [
+                f"✅ [{timestamp}] Batch processed: {len(batch)} locations"
+                " in single prompt"
+            ]
+            for location in list(results.keys())[:3]:
                 en_result, fr_result = results[location]
-                en_preview = en_result[:60] + "..." if len(en_result) > 60 else en_result
-                logger.info(f"   📍 {location}: {en_preview}")
-            
+                lines.append(f"   📍 {location}: {_preview(en_result, 60)}")
+
             if len(results) > 3:
-                logger.info(f"   ... and {len(results) - 3} more locations")
-            
-            # Log using centralized logging
-            logger.info(f"[{timestamp}] BATCH: {len(batch)} locations processed in single prompt")
-            
+                lines.append(f"   ... and {len(results) - 3} more locations")
+
+            logger.info("\n".join(lines))
+
         except Exception as e:
-            logger.error(f"Failed to log batch: {e}")
-    
+            logger.error("Failed to log batch: %s", e)
+
     def get_attraction_result(self, location: str) -> Tuple[str, str]:
         """
         Get the actual attraction result for a location after batch processing.
-        
+
         Args:
             location: The location name
-            
+
         Returns:
             Tuple of (mainAttractionEn, mainAttractionFr)
         """
-        if hasattr(self, 'batch_results') and location in self.batch_results:
+        if hasattr(self, "batch_results") and location in self.batch_results:
             return self.batch_results[location]
-        
+
         # Fallback if result not found
-        return f"Discover the unique charm and attractions of {location}.", f"Découvrez le charme unique et les attractions de {location}."
+        return (
+            f"Discover the unique charm and attractions of {location}.",
+            f"Découvrez le charme unique et les attractions de {location}.",
+        )
 
     def _parse_bilingual_response(self, response_text: str) -> list:
         """
         Parse the bilingual response to extract English and French parts.
-        
+
         Args:
             response_text: The raw response from Ollama
-            
+
         Returns:
             List containing [english_text, french_text]
         """
-        # Common patterns for bilingual responses
-        patterns = [
-            # Pattern: "English: ... French: ..."
-            (r"English:\s*(.*?)(?=French:|$)", r"French:\s*(.*?)$"),
-            # Pattern: "EN: ... FR: ..."
-            (r"EN:\s*(.*?)(?=FR:|$)", r"FR:\s*(.*?)$"),
-            # Pattern: "English: ... Français: ..."
-            (r"English:\s*(.*?)(?=Français:|$)", r"Français:\s*(.*?)$"),
-            # Pattern: "🇬🇧 ... 🇫🇷 ..."
-            (r"🇬🇧\s*(.*?)(?=🇫🇷|$)", r"🇫🇷\s*(.*?)$"),
-        ]
-        
-        for en_pattern, fr_pattern in patterns:
-            import re
-            en_match = re.search(en_pattern, response_text, re.DOTALL | re.IGNORECASE)
-            fr_match = re.search(fr_pattern, response_text, re.DOTALL | re.IGNORECASE)
-            
+        lowered = response_text.lower()
+        for en_marker, fr_marker, en_pattern, fr_pattern in BILINGUAL_PATTERNS:
+            if en_marker not in lowered or fr_marker not in lowered:
+                continue
+            en_match = en_pattern.search(response_text)
+            fr_match = fr_pattern.search(response_text)
+
             if en_match and fr_match:
                 return [en_match.group(1).strip(), fr_match.group(1).strip()]
-        
+
         # If no pattern matches, try to split by common separators
         separators = ["\n\n", "---", "===", "|||"]
         for separator in separators:
@@ -402,25 +638,25 @@ Tokyo: English: Experience the blend of ancient temples and cutting-edge technol
                 parts = response_text.split(separator, 1)
                 if len(parts) == 2:
                     return [parts[0].strip(), parts[1].strip()]
-        
+
         # If all else fails, return the entire response as English
         return [response_text, ""]
 
     def test_connection(self) -> bool:
         """
         Test the connection to Ollama and the model.
-        
+
         Returns:
             True if connection is successful, False otherwise
         """
         try:
-            response = ollama.generate(
+            response = _load_ollama().generate(
                 model=self.model,
                 prompt="Hello, this is a test.",
-                options={'max_tokens': 10}
+                options={"num_predict": 10},
             )
-            logger.info(f"Ollama connection test successful with model: {self.model}")
+            logger.info("Ollama connection test successful with model: %s", self.model)
             return True
         except Exception as e:
-            logger.error(f"Ollama connection test failed: {e}")
-            return False 
\ No newline at end of file
+            logger.error("Ollama connection test failed: %s", e)
+            return False
@@ -25,6 +25,7 @@ class TestCoordinates:
             "longitudeDirection": "E",
         }
         assert coord_dict == expected
+        assert sample_coordinates.to_dict() == expected
 
 
 class TestDestination:
@@ -38,6 +39,18 @@ class TestDestination:
         assert sample_destination.region == "Scandinavia"
         assert isinstance(sample_destination.coordinates, Coordinates)
 
+    def test_destination_default_links_shared(self, sample_destination):
+        """Test that destinations without links share the empty instance."""
+        other = Destination(
+            id=2,
+            location="Bergen, Norway",
+            coordinates=sample_destination.coordinates,
+            country="Norway",
+            region="Scandinavia",
+        )
+        assert other.extendedLinks is sample_destination.extendedLinks
+        assert asdict(other)["extendedLinks"]["streetView"] == ""
+
     def test_destination_to_dict(self, sample_destination):
         """Test destination serialization."""
         dest_dict = asdict(sample_destination)
@@ -47,6 +60,7 @@ class TestDestination:
         assert dest_dict["region"] == "Scandinavia"
         assert "coordinates" in dest_dict
         assert isinstance(dest_dict["coordinates"], dict)
+        assert sample_destination.to_dict() == dest_dict
 
 
 class TestChapter:
@@ -67,3 +81,4 @@ class TestChapter:
         assert chapter_dict["totalDestinations"] == 1
         assert len(chapter_dict["destinations"]) == 1
         assert "metadata" in chapter_dict
+        assert sample_chapter.to_dict() == chapter_dict
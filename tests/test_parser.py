@@ -1,9 +1,14 @@
 """Tests for the adventure guide parser."""
 
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 from find_your_next_adventure.parsers import AdventureGuideParser
+from find_your_next_adventure.parsers.adventure_guide_parser import (
+    FAILED_LINES_SAMPLE_SIZE,
+    STATS_SCOPE,
+)
+from find_your_next_adventure.utils import load_json
 
 
 class TestAdventureGuideParser:
@@ -67,6 +72,31 @@ class TestAdventureGuideParser:
         assert country == "Unknown"
         assert region == "Unknown"
 
+        # Test short keywords only match whole words
+        country, region = parser.identify_country_region("SYDNEY, AUSTRALIA")
+        assert country == "Australia"
+
+        # Test adjectival country names from the guide (ids 613 and 1000)
+        country, region = parser.identify_country_region("SAHARAN ALGERIAN REGION")
+        assert (country, region) == ("Algeria", "North Africa")
+        country, _ = parser.identify_country_region("CHILEAN ANTARCTIC TERRITORY")
+        assert country == "Chile"
+
+        # Test feature fallback
+        country, region = parser.identify_country_region("SOME ISLANDS")
+        assert region == "Islands"
+
+    def test_chapter_for_id(self):
+        """Test chapter lookup by destination id."""
+        parser = AdventureGuideParser()
+
+        assert parser.chapter_for_id(1) == 1
+        assert parser.chapter_for_id(44) == 1
+        assert parser.chapter_for_id(45) == 2
+        assert parser.chapter_for_id(1000) == 8
+        assert parser.chapter_for_id(0) is None
+        assert parser.chapter_for_id(1001) is None
+
     def test_parse_line_success(self):
         """Test successful line parsing."""
         parser = AdventureGuideParser()
@@ -82,6 +112,18 @@ class TestAdventureGuideParser:
         assert destination.coordinates.latitude == 59.9139
         assert destination.coordinates.longitude == 10.7522
 
+    def test_parse_line_irregular_spacing(self):
+        """Test lines outside the canonical spacing fall back to the pattern."""
+        parser = AdventureGuideParser()
+        line = "1.  Oslo, Norway  -  Latitude:59.9139N  Longitude:10.7522E"
+
+        destination = parser.parse_line(line)
+
+        assert destination is not None
+        assert destination.location == "Oslo, Norway"
+        assert destination.coordinates.latitude == 59.9139
+        assert destination.coordinates.longitudeDirection == "E"
+
     def test_parse_line_failure(self):
         """Test line parsing failure cases."""
         parser = AdventureGuideParser()
@@ -96,15 +138,27 @@ class TestAdventureGuideParser:
         assert destination is None
         assert parser.stats["failed"] == 2
 
+    def test_failed_lines_sample_bounded(self):
+        """Test only a bounded sample of failed lines is kept."""
+        parser = AdventureGuideParser()
+
+        for i in range(FAILED_LINES_SAMPLE_SIZE + 10):
+            parser.parse_line(f"Invalid line {i}")
+
+        assert parser.stats["failed"] == FAILED_LINES_SAMPLE_SIZE + 10
+        assert len(parser.failed_lines) == FAILED_LINES_SAMPLE_SIZE
+        assert parser.failed_lines[0] == "Invalid line 0"
+
     @patch("find_your_next_adventure.parsers.adventure_guide_parser.fitz")
     def test_load_pdf_success(self, mock_fitz):
         """Test successful PDF loading."""
         # Mock fitz document
-        mock_doc = Mock()
+        mock_doc = MagicMock()
         mock_page = Mock()
         mock_page.get_text.return_value = "Sample text"
-        mock_doc.__iter__ = Mock(return_value=iter([mock_page]))
-        mock_doc.close = Mock()
+        mock_doc.__iter__.return_value = iter([mock_page])
+        mock_doc.__enter__.return_value = mock_doc
+        mock_doc.page_count = 1
         mock_fitz.open.return_value = mock_doc
 
         parser = AdventureGuideParser()
@@ -112,7 +166,7 @@ class TestAdventureGuideParser:
 
         assert content == "Sample text\n"
         mock_fitz.open.assert_called_once_with(Path("test.pdf"))
-        mock_doc.close.assert_called_once()
+        mock_doc.__exit__.assert_called_once()
 
     @patch("find_your_next_adventure.parsers.adventure_guide_parser.fitz")
     def test_load_pdf_failure(self, mock_fitz):
@@ -124,6 +178,17 @@ class TestAdventureGuideParser:
 
         assert content == ""
 
+    @patch("find_your_next_adventure.parsers.adventure_guide_parser.fitz")
+    def test_process_pdf_load_failure(self, mock_fitz, tmp_path, caplog):
+        """Test an unreadable PDF is logged and skipped instead of raising."""
+        mock_fitz.open.side_effect = RuntimeError("cannot open broken document")
+
+        parser = AdventureGuideParser()
+        parser.process_pdf(Path("broken.pdf"), tmp_path / "output")
+
+        assert not (tmp_path / "output").exists()
+        assert "cannot open broken document" in caplog.text
+
     def test_parse_pdf_content(self, sample_pdf_content):
         """Test PDF content parsing."""
         parser = AdventureGuideParser()
@@ -141,3 +206,34 @@ class TestAdventureGuideParser:
         # Verify stats
         assert parser.stats["successful"] == 3
         assert parser.stats["processed"] == 3
+
+    def test_parse_pdf_content_records_near_misses(self, sample_pdf_content, tmp_path):
+        """Test only numbered lines are counted, and rejects are recorded."""
+        parser = AdventureGuideParser()
+        content = (
+            "CHAPTER 1\n"
+            + sample_pdf_content
+            + "4. Bergen, Norway - Latitude: unknown\n2.5 km\n"
+        )
+        parser.parse_pdf_content(content)
+
+        assert parser.stats["processed"] == 4
+        assert parser.stats["failed"] == 1
+        assert parser.failed_lines == ["4. Bergen, Norway - Latitude: unknown"]
+
+        parser.save_debug_report(tmp_path)
+        report = load_json(tmp_path / "debug_report.json")
+        assert report["counting"] == STATS_SCOPE
+        assert report["total_failed_lines"] == 1
+
+    def test_parse_pdf_content_pages(self, sample_pdf_content):
+        """Test parsing content streamed page by page."""
+        parser = AdventureGuideParser()
+        pages = iter(sample_pdf_content.splitlines(keepends=True))
+        chapters_data = parser.parse_pdf_content(pages)
+
+        total_destinations = sum(
+            len(destinations) for destinations in chapters_data.values()
+        )
+        assert total_destinations == 3
+        assert parser.stats["processed"] == 3
@@ -0,0 +1,341 @@
+"""Tests for utility functions."""
+
+import json
+import logging
+import math
+from array import array
+from unittest.mock import patch
+
+import pytest
+
+from find_your_next_adventure.models import Coordinates
+from find_your_next_adventure.utils import (
+    apply_hemisphere_signs,
+    backup_file,
+    calculate_distance,
+    calculate_distances_bulk,
+    coordinates,
+    decimal_to_dms,
+    distances_from,
+    file_io,
+    get_coordinate_bounds,
+    load_json,
+    nearest_coordinates,
+    ollama_generator,
+    save_json,
+    write_json,
+)
+from find_your_next_adventure.utils.maps import clean_location_name
+from find_your_next_adventure.utils.ollama_generator import OllamaGenerator
+
+
+class TestCoordinateUtils:
+    """Test cases for coordinate utilities."""
+
+    def test_apply_hemisphere_signs(self):
+        """Test batch sign application for southern/western values."""
+        latitudes = array("d", [59.9, 33.4, 0.0])
+        apply_hemisphere_signs(latitudes, ["N", "S", "S"], "S")
+        assert list(latitudes) == [59.9, -33.4, -0.0]
+
+        longitudes = [10.7, 70.6]
+        apply_hemisphere_signs(longitudes, ["E", "W"], "W")
+        assert longitudes == [10.7, -70.6]
+
+    def test_get_coordinate_bounds(self, sample_destination):
+        """Test the bounding box of a list of coordinates."""
+        bounds = get_coordinate_bounds([sample_destination.coordinates])
+
+        assert bounds["center_latitude"] == sample_destination.coordinates.latitude
+        assert bounds["min_longitude"] == sample_destination.coordinates.longitude
+        assert get_coordinate_bounds([]) == {}
+
+    def test_decimal_to_dms(self):
+        """Test conversion of decimal degrees to degrees, minutes, seconds."""
+        degrees, minutes, seconds = decimal_to_dms(59.9139)
+        assert (degrees, minutes) == (59, 54)
+        assert seconds == pytest.approx(50.04)
+        assert decimal_to_dms(10.5) == (10, 30, 0.0)
+
+    def test_calculate_distances_bulk(self, monkeypatch):
+        """Test bulk distances match the scalar Haversine, with or without NumPy."""
+        oslo = Coordinates(59.9139, 10.7522, "N", "E")
+        santiago = Coordinates(-33.4489, -70.6693, "S", "W")
+        expected = [
+            calculate_distance(oslo, santiago),
+            calculate_distance(santiago, santiago),
+        ]
+        columns = (
+            [59.9139, -33.4489],
+            [10.7522, -70.6693],
+            [-33.4489, -33.4489],
+            [-70.6693, -70.6693],
+        )
+
+        monkeypatch.setattr(coordinates, "np", None)
+        assert list(calculate_distances_bulk(*columns)) == pytest.approx(expected)
+
+    def test_vectorized_distances_match_scalar(self):
+        """Test the NumPy paths agree with the scalar Haversine."""
+        pytest.importorskip("numpy")
+        oslo = Coordinates(59.9139, 10.7522, "N", "E")
+        others = [
+            Coordinates(-33.4489, -70.6693, "S", "W"),
+            Coordinates(60.3913, 5.3221, "N", "E"),
+            Coordinates(59.9139 + 1e-6, 10.7522, "N", "E"),
+        ]
+        expected = [calculate_distance(oslo, other) for other in others]
+        latitudes = [c.latitude for c in others]
+        longitudes = [c.longitude for c in others]
+
+        bulk = calculate_distances_bulk(
+            [oslo.latitude] * 3, [oslo.longitude] * 3, latitudes, longitudes
+        )
+        assert list(bulk) == pytest.approx(expected, rel=1e-6)
+        distances = distances_from(oslo, latitudes, longitudes)
+        assert list(distances) == pytest.approx(expected, rel=1e-6)
+
+    def test_calculate_distance_short(self, monkeypatch):
+        """Test points 1e-6 degrees apart are measured without cancellation."""
+        oslo = Coordinates(59.9139, 10.7522, "N", "E")
+        nearby = Coordinates(59.9139 + 1e-6, 10.7522, "N", "E")
+        expected = coordinates.EARTH_RADIUS_KM * math.radians(1e-6)
+
+        assert calculate_distance(oslo, nearby) == pytest.approx(expected, rel=1e-6)
+        monkeypatch.setattr(coordinates, "np", None)
+        (distance,) = distances_from(oslo, [nearby.latitude], [nearby.longitude])
+        assert distance == pytest.approx(expected, rel=1e-6)
+
+    def test_distances_from(self, monkeypatch):
+        """Test one-to-many distances match the scalar Haversine."""
+        oslo = Coordinates(59.9139, 10.7522, "N", "E")
+        others = [
+            Coordinates(-33.4489, -70.6693, "S", "W"),
+            Coordinates(60.3913, 5.3221, "N", "E"),
+        ]
+        expected = [calculate_distance(oslo, other) for other in others]
+
+        monkeypatch.setattr(coordinates, "np", None)
+        distances = distances_from(
+            oslo, [c.latitude for c in others], [c.longitude for c in others]
+        )
+        assert list(distances) == pytest.approx(expected)
+
+    def test_nearest_coordinates(self):
+        """Test the k nearest candidates are returned closest first."""
+        candidates = [
+            Coordinates(-33.4489, -70.6693, "S", "W"),
+            Coordinates(60.3913, 5.3221, "N", "E"),
+            Coordinates(59.9139, 10.7522, "N", "E"),
+        ]
+        query = Coordinates(59.9, 10.7, "N", "E")
+
+        nearest = nearest_coordinates(query, candidates, k=2)
+        assert [index for _, index in nearest] == [2, 1]
+        assert nearest[0][0] < 5
+        assert nearest_coordinates(query, [], k=2) == []
+
+
+class TestMaps:
+    """Test cases for map link utilities."""
+
+    def test_clean_location_name(self):
+        """Test prefixes, country suffixes and stray punctuation are removed."""
+        assert clean_location_name("START IN Oslo, Norway") == "Oslo, Norway"
+        assert clean_location_name("near  the Alps;; France ,") == "the Alps, France"
+        assert clean_location_name("Lake  District,\tUNITED KINGDOM") == "Lake District"
+        assert clean_location_name("NEAR US") == "US"
+
+
+class TestFileIO:
+    """Test cases for file I/O utilities."""
+
+    def test_write_json_dataclass(self, tmp_path, sample_chapter, monkeypatch):
+        """Test writing dataclasses with and without orjson."""
+        fast_path = tmp_path / "fast.json"
+        write_json(sample_chapter, fast_path)
+
+        monkeypatch.setattr(file_io, "orjson", None)
+        stdlib_path = tmp_path / "stdlib.json"
+        write_json(sample_chapter, stdlib_path)
+
+        assert fast_path.read_bytes() == stdlib_path.read_bytes()
+        data = json.loads(stdlib_path.read_text(encoding="utf-8"))
+        assert data["destinations"][0]["location"] == "Oslo, Norway"
+        assert data["destinations"][0]["coordinates"]["latitude"] == 59.9139
+
+    def test_save_and_load_json(self, tmp_path, monkeypatch):
+        """Test a JSON round trip with and without orjson."""
+        data = {"location": "Tromsø, Norway", "ids": [1, 2]}
+        assert save_json(data, tmp_path / "fast" / "data.json")
+        assert load_json(tmp_path / "fast" / "data.json") == data
+
+        monkeypatch.setattr(file_io, "orjson", None)
+        assert save_json(data, tmp_path / "stdlib.json")
+        assert load_json(tmp_path / "stdlib.json") == data
+        assert load_json(tmp_path / "missing.json") is None
+
+    def test_save_json_int_keys_and_fallback(self, tmp_path):
+        """Test orjson writes non-str keys and falls back to json on TypeError."""
+        assert save_json({1: "a", 2: "b"}, tmp_path / "keys.json")
+        assert load_json(tmp_path / "keys.json") == {"1": "a", "2": "b"}
+
+        class Place:
+            def to_dict(self):
+                return {"location": "Oslo"}
+
+        assert save_json({"place": Place()}, tmp_path / "fallback.json")
+        assert load_json(tmp_path / "fallback.json") == {"place": {"location": "Oslo"}}
+
+    def test_backup_file(self, tmp_path):
+        """Test a backup copy is written next to the original."""
+        original = tmp_path / "guide.json"
+        original.write_bytes(b'{"destinations": []}')
+
+        assert backup_file(original)
+        assert (tmp_path / "guide.json.backup").read_bytes() == original.read_bytes()
+        assert not backup_file(tmp_path / "missing.json")
+
+
+class TestOllamaGenerator:
+    """Test cases for the Ollama generator."""
+
+    @staticmethod
+    def _answer(model, prompt, options, stream=False, keep_alive=None):
+        """Stream an answer for every location listed in a batch prompt."""
+        names = [
+            line[2:].split(" (")[0]
+            for line in prompt.splitlines()
+            if line.startswith("- ")
+        ]
+        for name in names:
+            yield {"response": f"{name}: English: See {name} | French: "}
+            yield {"response": f"Voir {name}\n"}
+        yield {"response": "I hope these help!"}
+
+    @patch("find_your_next_adventure.utils.ollama_generator.ollama")
+    def test_process_batch_collects_all_results(self, mock_ollama):
+        """Test batches sent in the background all land before force returns."""
+        mock_ollama.generate.side_effect = self._answer
+        generator = OllamaGenerator(batch_size=2, max_workers=3)
+
+        locations = [f"Place {i}" for i in range(7)]
+        for location in locations + locations[:2]:
+            generator.generate_attractions(location, "Country", "Region")
+        generator.process_batch(force=True)
+
+        assert mock_ollama.generate.call_count == 4
+        assert generator.stats["total_calls"] == 4
+        for location in locations:
+            assert generator.get_attraction_result(location) == (
+                f"See {location}",
+                f"Voir {location}",
+            )
+
+    @patch("find_your_next_adventure.utils.ollama_generator.ollama")
+    def test_attraction_cache_checkpointed(self, mock_ollama, tmp_path, monkeypatch):
+        """Test the cache is written mid-run once enough answers accumulate."""
+        mock_ollama.generate.side_effect = self._answer
+        monkeypatch.setattr(ollama_generator, "CACHE_SAVE_INTERVAL", 2)
+        cache_path = tmp_path / "attractions.json"
+
+        generator = OllamaGenerator(batch_size=2, max_workers=1, cache_path=cache_path)
+        generator.generate_attractions("Oslo", "Norway", "Scandinavia")
+        generator.generate_attractions("Bergen", "Norway", "Scandinavia")
+        generator._pending[0].result()
+
+        assert len(load_json(cache_path)) == 2
+        generator.process_batch(force=True)
+
+    def test_max_workers_from_environment(self, monkeypatch):
+        """Test OLLAMA_CONCURRENCY sets the default number of concurrent batches."""
+        monkeypatch.setenv("OLLAMA_CONCURRENCY", "8")
+        assert OllamaGenerator().max_workers == 8
+        assert OllamaGenerator(max_workers=2).max_workers == 2
+
+    @pytest.mark.parametrize("value", ["0", "-2", "four", ""])
+    def test_invalid_max_workers_from_environment(self, monkeypatch, caplog, value):
+        """Test an invalid OLLAMA_CONCURRENCY falls back to 4 with a warning."""
+        monkeypatch.setenv("OLLAMA_CONCURRENCY", value)
+        with caplog.at_level(logging.WARNING):
+            assert OllamaGenerator().max_workers == 4
+        assert "OLLAMA_CONCURRENCY" in caplog.text
+
+    def test_model_from_environment(self, monkeypatch):
+        """Test OLLAMA_MODEL overrides the default model tag."""
+        monkeypatch.delenv("OLLAMA_MODEL", raising=False)
+        assert OllamaGenerator().model == "phi4-mini"
+        monkeypatch.setenv("OLLAMA_MODEL", "phi4-mini:3.8b-q4_0")
+        assert OllamaGenerator().model == "phi4-mini:3.8b-q4_0"
+        assert OllamaGenerator(model="llama3.2").model == "llama3.2"
+
+    def test_attraction_cache_not_a_dict(self, tmp_path):
+        """Test a cache file holding anything but an object starts empty."""
+        cache_path = tmp_path / "attractions.json"
+        cache_path.write_text('["Oslo"]', encoding="utf-8")
+
+        assert OllamaGenerator(cache_path=cache_path)._cache == {}
+
+    @patch("find_your_next_adventure.utils.ollama_generator.ollama")
+    def test_attraction_cache_reused(self, mock_ollama, tmp_path):
+        """Test attractions cached by one run are reused by the next."""
+        mock_ollama.generate.side_effect = self._answer
+        cache_path = tmp_path / "cache" / "attractions.json"
+
+        generator = OllamaGenerator(batch_size=2, cache_path=cache_path)
+        generator.generate_attractions("Oslo", "Norway", "Scandinavia")
+        generator.process_batch(force=True)
+        assert cache_path.exists()
+        assert not cache_path.with_name("attractions.json.tmp").exists()
+
+        mock_ollama.generate.reset_mock()
+        generator = OllamaGenerator(batch_size=2, cache_path=cache_path)
+        result = generator.generate_attractions("Oslo", "Norway", "Scandinavia")
+        generator.process_batch(force=True)
+
+        assert result == ("See Oslo", "Voir Oslo")
+        assert generator.get_attraction_result("Oslo") == result
+        mock_ollama.generate.assert_not_called()
+
+        generator = OllamaGenerator(
+            model="other-model", batch_size=2, cache_path=cache_path
+        )
+        generator.generate_attractions("Oslo", "Norway", "Scandinavia")
+        generator.process_batch(force=True)
+        mock_ollama.generate.assert_called_once()
+
+    def test_parse_bilingual_response(self):
+        """Test each supported bilingual layout and the separator fallback."""
+        generator = OllamaGenerator()
+        parse = generator._parse_bilingual_response
+
+        assert parse("English: Fjords. French: Fjords.") == ["Fjords.", "Fjords."]
+        assert parse("EN: Sea\nFR: Mer") == ["Sea", "Mer"]
+        assert parse("🇬🇧 Sea 🇫🇷 Mer") == ["Sea", "Mer"]
+        assert parse("Sea\n\nMer") == ["Sea", "Mer"]
+        assert parse("English: only") == ["English: only", ""]
+
+    @patch("find_your_next_adventure.utils.ollama_generator.ollama")
+    def test_stream_stops_after_last_answer(self, mock_ollama):
+        """Test streaming stops once every location has a finished answer."""
+        stream = self._answer(None, "- Oslo (Norway, Scandinavia)", None)
+        mock_ollama.generate.return_value = stream
+        generator = OllamaGenerator()
+
+        batch = [{"location": "Oslo"}]
+        response = generator._stream_batch_response("prompt", batch)
+
+        assert response == "Oslo: English: See Oslo | French: Voir Oslo\n"
+        assert stream.gi_frame is None
+
+    @patch("find_your_next_adventure.utils.ollama_generator.ollama")
+    def test_stream_ignores_echoed_examples(self, mock_ollama):
+        """Test echoed example lines do not end the stream early."""
+        example = "Paris: English: See Paris | French: Voir Paris\n"
+        answer = self._answer(None, "- Oslo (Norway, Scandinavia)", None)
+        mock_ollama.generate.return_value = iter([{"response": example}, *answer])
+        generator = OllamaGenerator()
+
+        response = generator._stream_batch_response("prompt", [{"location": "Oslo"}])
+
+        assert response.endswith("Oslo: English: See Oslo | French: Voir Oslo\n")